@@ -35,13 +35,15 @@ except Exception:
     PINK = GREEN = CYAN = YELLOW = RED = BRIGHT = RESET = ""
 
 _ansi_re = re.compile(r"\x1b\[[0-9;]*m")
-def _visible_len(s: str) -> int: return len(_ansi_re.sub("", s))
+def _visible_len(s: str) -> int:
+    return len(s) if "\x1b" not in s else len(_ansi_re.sub("", s))
 
 def box(lines: List[str], color=CYAN) -> None:
-    width = max(_visible_len(t) for t in lines) if lines else 0
+    widths = [_visible_len(t) for t in lines]  # measured once, reused for padding
+    width = max(widths, default=0)
     print(color + "╔" + "═" * (width + 2) + "╗" + RESET)
-    for t in lines:
-        pad = width - _visible_len(t)
+    for t, w in zip(lines, widths):
+        pad = width - w
         print(color + "║ " + RESET + t + " " * pad + color + " ║" + RESET)
     print(color + "╚" + "═" * (width + 2) + "╝" + RESET)
 
@@ -30,15 +30,18 @@ import re as _re
 _ansi_re = _re.compile(r"\x1b\[[0-9;]*m")
 
 def _visible_len(s: str) -> int:
+    if "\x1b" not in s:
+        return len(s)
     return len(_ansi_re.sub("", s))
 
 def box(text_lines, color=CYAN):
-    width = max(_visible_len(t) for t in text_lines) if text_lines else 0
+    # Measure each line once (used for both width and padding)
+    widths = [_visible_len(t) for t in text_lines]
+    width = max(widths, default=0)
     top = "╔" + "═" * (width + 2) + "╗"
     bot = "╚" + "═" * (width + 2) + "╝"
     print(color + top + RESET)
-    for t in text_lines:
-        vis = _visible_len(t)
+    for t, vis in zip(text_lines, widths):
         pad = width - vis
         print(color + "║ " + RESET + t + " " * pad + color + " ║" + RESET)
     print(color + bot + RESET)
@@ -12,11 +12,15 @@ import re
 import time
 import unicodedata
 import difflib
+import json
+import functools
 import shutil
+import threading
 import requests
 import random
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, NamedTuple
+from typing import Dict, List, Tuple, Optional, NamedTuple, Sequence
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from tqdm import tqdm
 from PIL import Image
 from io import BytesIO
@@ -76,9 +80,83 @@ BACKOFF_JITTER = 0.35  # jitter
 
 # --- Batch behavior ---
 SET_PAUSE = 1.5        # Small pause between SETS (managing WinError 10054 on ALL sets)
+PREFLIGHT_AHEAD = 4    # Fast CSV ALL SETs: sets prepared ahead while one downloads
+SET_MIN_GAP = 0.05     # Fast CSV ALL SETs: min gap since the last HTTP call before next set
+DL_WORKERS = 8         # Parallel image downloads per SET
+SEARCH_PAGE_SIZE = 175   # Scryfall /cards/search page size
+SEARCH_WORKERS = 4       # Parallel search pages for big sets
+STREAM_CHUNK = 64 * 1024  # Chunk size when streaming images straight to disk
+DL_QUEUE = DL_WORKERS * 4  # Max image jobs queued on the pool at once (Ctrl+C doesn't wait on the whole set)
+JPEG_QUALITY = 90         # Card JPEG quality (rotated / horizontal cards re-encoded by PIL)
+JPEG_SUBSAMPLING = 2      # 4:2:0 chroma - smaller, faster saves
 
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": "ForgeImageFetcher/1.1 (laryzinha-scrapper)"})
+# Pool sized for the download workers (default pool keeps only 10 connections per host)
+POOL_MAXSIZE = 32
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=POOL_MAXSIZE))
+
+def get_session() -> requests.Session:
+    """Canonical HTTP client shared by every integrated module (one connection pool)."""
+    return SESSION
+
+def ensure_pool_size(workers: int) -> None:
+    """
+    Grow the shared keep-alive pool so `workers` threads can each hold a connection.
+    Without it, Fast CSV runs above POOL_MAXSIZE threads drop and re-handshake connections.
+    """
+    global POOL_MAXSIZE
+    if workers <= POOL_MAXSIZE:
+        return
+    POOL_MAXSIZE = workers
+    SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=workers))
+
+# Shared-session contract: sibling modules keep their own SESSION for standalone use,
+# but when launched from here they are pointed at ours so TLS/TCP connections are reused.
+for _mod in (fcsv, spn, sc, ad, dt):
+    if _mod is not None and hasattr(_mod, "SESSION"):
+        _mod.SESSION = SESSION
+
+# Monotonic timestamp of the last HTTP activity (used to pace batch loops)
+_last_http = 0.0
+
+def mark_http() -> None:
+    global _last_http
+    _last_http = time.monotonic()
+
+def pause_since_last_http(min_gap: float) -> None:
+    """Sleep only for what is left of min_gap since the last HTTP call (usually nothing)."""
+    gap = time.monotonic() - _last_http
+    if gap < min_gap:
+        time.sleep(min_gap - gap)
+
+class TokenBucket:
+    """
+    Shared rate limiter: `rate` tokens/s, up to `capacity` banked.
+    acquire() reserves a token under the lock and sleeps outside it, so waiting
+    threads don't block each other's bookkeeping.
+    """
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait_s = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_s > 0:
+            time.sleep(wait_s)
+
+# API: same average pace as the old sleep-after-each-call (1 / RATE_SLEEP per second).
+# Images: the pace DL_WORKERS sleeping workers used to reach, but shared instead of per thread.
+API_LIMITER = TokenBucket(rate=1 / RATE_SLEEP, capacity=1)
+IMG_LIMITER = TokenBucket(rate=DL_WORKERS / RATE_SLEEP, capacity=DL_WORKERS)
 
 # ---------- Wrapper ----------
 
@@ -90,11 +168,16 @@ def scry_get_json(url: str, *, params: dict | None = None) -> dict:
     - 429 (rate limit)
     - 5xx
     """
+    return scry_get(url, params=params).json()
+
+def scry_get(url: str, *, params: dict | None = None, headers: dict | None = None) -> requests.Response:
+    """Same retry/backoff as scry_get_json, but returns the response (headers, 304 handling)."""
     last_exc = None
 
     for attempt in range(1, RETRY + 1):
         try:
-            r = SESSION.get(url, params=params, timeout=TIMEOUT)
+            API_LIMITER.acquire()
+            r = SESSION.get(url, params=params, headers=headers, timeout=TIMEOUT)
 
             # Rate-limit / servidor instável
             if r.status_code == 429 or 500 <= r.status_code <= 599:
@@ -102,10 +185,9 @@ def scry_get_json(url: str, *, params: dict | None = None) -> dict:
 
             r.raise_for_status()
 
-            # throttle leve entre requests bem-sucedidos
-            time.sleep(RATE_SLEEP)
+            mark_http()
 
-            return r.json()
+            return r
 
         except (
             requests.exceptions.Timeout,
@@ -134,13 +216,14 @@ def download_bytes_with_retry(url: str) -> bytes:
 
     for attempt in range(1, RETRY + 1):
         try:
+            IMG_LIMITER.acquire()
             with SESSION.get(url, stream=True, timeout=TIMEOUT) as r:
                 if r.status_code == 429 or 500 <= r.status_code <= 599:
                     raise requests.exceptions.HTTPError(f"HTTP {r.status_code}", response=r)
 
                 r.raise_for_status()
                 content = r.content  # ok aqui (imagem)
-            time.sleep(RATE_SLEEP)
+            mark_http()
             return content
 
         except (
@@ -158,6 +241,51 @@ def download_bytes_with_retry(url: str) -> bytes:
 
     raise last_exc
 
+def download_to_file_with_retry(url: str, out_path: Path) -> None:
+    """
+    Same retry/backoff as download_bytes_with_retry, but streams the body to disk
+    in 64 KiB chunks (via a .part file) instead of holding the whole image in memory.
+    """
+    last_exc = None
+    part = out_path.with_name(out_path.name + ".part")
+
+    for attempt in range(1, RETRY + 1):
+        try:
+            IMG_LIMITER.acquire()
+            with SESSION.get(url, stream=True, timeout=TIMEOUT) as r:
+                if r.status_code == 429 or 500 <= r.status_code <= 599:
+                    raise requests.exceptions.HTTPError(f"HTTP {r.status_code}", response=r)
+
+                r.raise_for_status()
+                # iter_content (not r.raw) so a stall/reset mid-body surfaces as a requests
+                # exception and is retried like a failed GET
+                with open(part, "wb") as f:
+                    f.writelines(r.iter_content(STREAM_CHUNK))
+            os.replace(part, out_path)
+            mark_http()
+            return
+
+        except (
+            requests.exceptions.Timeout,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ContentDecodingError,
+            requests.exceptions.HTTPError,
+            OSError,
+        ) as e:
+            last_exc = e
+            try:
+                part.unlink()  # never leave a truncated body behind, even between attempts
+            except OSError:
+                pass
+            sleep_s = (BACKOFF_BASE ** attempt) + (random.random() * BACKOFF_JITTER)
+            if attempt == RETRY:
+                raise
+            print(f"{YELLOW}[net-img]{RESET} retry {attempt}/{RETRY} in {sleep_s:.1f}s — {e}")
+            time.sleep(sleep_s)
+
+    raise last_exc
+
 # ---------- Utils ----------
 
 def script_root_cards() -> Path:
@@ -168,6 +296,12 @@ def script_root_cards() -> Path:
         base = Path.cwd()
     return base / "Cards"
 
+# Default Sets.txt for the batch option (next to the script)
+SETS_TXT_DEFAULT = (Path(__file__).resolve().parent / "Sets.txt") if "__file__" in globals() else (Path.cwd() / "Sets.txt")
+
+# /sets cache (ETag / Last-Modified revalidation), kept next to the script
+SETS_CACHE = script_root_cards().parent / "cache" / "sets.json"
+
 # --- App brand ---
 APP_NAME = "Laryzinha Scryfall Scrapper"
 APP_VERSION = "1.1.4-beta.1"
@@ -192,19 +326,30 @@ _ansi_re = re.compile(r"\x1b\[[0-9;]*m")
 
 def _visible_len(s: str) -> int:
     """Visible length without ANSI codes (for box alignment)."""
+    # Fast path: plain lines (no escape codes) skip the regex entirely
+    if "\x1b" not in s:
+        return len(s)
     return len(_ansi_re.sub("", s))
 
-def box(text_lines: List[str], color=CYAN) -> None:
-    width = max(_visible_len(t) for t in text_lines) if text_lines else 0
+def box(text_lines: Sequence[str], color=CYAN) -> None:
+    # Measure each line once (used for both width and padding)
+    lens = [_visible_len(t) for t in text_lines]
+    width = max(lens) if lens else 0
     top = "╔" + "═" * (width + 2) + "╗"
     bot = "╚" + "═" * (width + 2) + "╝"
     print(color + top + RESET)
-    for t in text_lines:
-        vis = _visible_len(t)
+    for t, vis in zip(text_lines, lens):
         pad = width - vis
         print(color + "║ " + RESET + t + " " * pad + color + " ║" + RESET)
     print(color + bot + RESET)
 
+# Windows reserved device names (CON, PRN, AUX, NUL, COM1.., LPT1..)
+_WIN_RESERVED = frozenset(
+    {"CON", "PRN", "AUX", "NUL"}
+    | {f"COM{i}" for i in range(1, 10)}
+    | {f"LPT{i}" for i in range(1, 10)}
+)
+
 def safe_set_folder_name(set_code: str) -> str:
     """
     Windows-safe folder name for set codes.
@@ -219,11 +364,7 @@ def safe_set_folder_name(set_code: str) -> str:
     code = code.rstrip(" .")
 
     if os.name == "nt":
-        reserved = {"CON", "PRN", "AUX", "NUL"}
-        reserved |= {f"COM{i}" for i in range(1, 10)}
-        reserved |= {f"LPT{i}" for i in range(1, 10)}
-
-        if code.upper() in reserved:
+        if code.upper() in _WIN_RESERVED:
             code = f"_{code}"   # prefix to keep it unique and obvious
 
     return code
@@ -232,11 +373,7 @@ def is_windows_reserved_set_code(set_code: str) -> bool:
     """True if code is a Windows reserved device name (CON, PRN, AUX, NUL, COM1.., LPT1..)."""
     if os.name != "nt":
         return False
-    code = (set_code or "").strip().upper()
-    reserved = {"CON", "PRN", "AUX", "NUL"}
-    reserved |= {f"COM{i}" for i in range(1, 10)}
-    reserved |= {f"LPT{i}" for i in range(1, 10)}
-    return code in reserved
+    return (set_code or "").strip().upper() in _WIN_RESERVED
 
 
 def promote_reserved_set_folder(base_dir: Path, set_code: str) -> tuple[bool, str]:
@@ -258,6 +395,17 @@ def promote_reserved_set_folder(base_dir: Path, set_code: str) -> tuple[bool, st
     if not temp_dir.exists() or not temp_dir.is_dir():
         return (False, "temp_missing")
 
+    # Fast path: final folder doesn't exist yet -> one directory rename
+    if not final_dir.exists():
+        try:
+            moved = sum(1 for _ in os.scandir(temp_dir))
+            os.replace(temp_dir, final_dir)
+            if moved > 0:
+                return (True, f"promoted: moved={moved}, conflicts=0, errors=0")
+            return (False, "no_move: conflicts=0, errors=0")
+        except OSError:
+            pass  # fall back to per-item moves below
+
     # Try to create the final folder (may fail in some Windows contexts)
     try:
         final_dir.mkdir(parents=True, exist_ok=True)
@@ -284,7 +432,7 @@ def promote_reserved_set_folder(base_dir: Path, set_code: str) -> tuple[bool, st
 
     # Remove temp folder if empty
     try:
-        if not any(temp_dir.iterdir()):
+        if not _is_nonempty(temp_dir):
             temp_dir.rmdir()
     except Exception:
         pass
@@ -295,10 +443,17 @@ def promote_reserved_set_folder(base_dir: Path, set_code: str) -> tuple[bool, st
     return (False, f"no_move: conflicts={conflicts}, errors={errors}")
 
 
+_SLUG_RE = re.compile(r'[<>:\"/\\|?*\x00-\x1F]')
+
+def _slug_repl(m: "re.Match[str]") -> str:
+    return "-" if m.group() == ":" else "_"
+
+@functools.lru_cache(maxsize=4096)
 def slugify_filename(name: str) -> str:
-    name = name.strip().replace(":", "-")
-    return re.sub(r'[<>:\"/\\|?*\x00-\x1F]', "_", name)
+    # one pass: ":" -> "-", every other invalid char -> "_"
+    return _SLUG_RE.sub(_slug_repl, name.strip())
 
+@functools.lru_cache(maxsize=4096)
 def strip_accents(s: str) -> str:
     return "".join(c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn")
 
@@ -315,89 +470,420 @@ def ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
 
 def clear_directory(p: Path):
-    for item in p.iterdir():
-        if item.is_dir():
-            shutil.rmtree(item, ignore_errors=True)
-        else:
-            try:
-                item.unlink()
-            except Exception:
-                pass
+    # DirEntry type info comes from the directory listing itself (no extra stat per file)
+    with os.scandir(p) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+
+def _index_dir(p: Path) -> Dict[str, int]:
+    """One os.scandir pass: file name -> size (empty dict if the folder is missing)."""
+    try:
+        with os.scandir(p) as it:
+            return {e.name: e.stat().st_size for e in it if e.is_file()}
+    except FileNotFoundError:
+        return {}
+
+def _index_names(p: Path) -> List[str]:
+    """Entry names of a folder in one listing (empty if the folder is missing)."""
+    try:
+        return os.listdir(p)
+    except FileNotFoundError:
+        return []
+
+def _is_nonempty(p: Path) -> bool:
+    """True as soon as the folder yields one entry (no full listing); False if missing."""
+    try:
+        with os.scandir(p) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return False
 
+def discard_dir_in_background(p: Path) -> None:
+    """
+    Move a folder out of the way (one rename) and delete it on a worker thread,
+    so the next download can start right away. Falls back to a plain rmtree.
+    """
+    trash = p.with_name(f"{p.name}.trash.{int(time.time())}")
+    try:
+        os.replace(p, trash)
+    except OSError:
+        shutil.rmtree(p)
+        return
+    # Not a daemon: a short exit wait beats leaving *.trash.* folders behind
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}).start()
+
+@functools.lru_cache(maxsize=1)
 def get_all_sets() -> List[dict]:
-    js = scry_get_json(f"{SCRYFALL_API}/sets")
-    return js.get("data", [])
+    # One /sets fetch per session (menus and batch modes share the same list).
+    # The list is also kept on disk with its validators: unchanged => 304 and no body.
+    cached = _read_sets_cache()
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        r = scry_get(f"{SCRYFALL_API}/sets", headers=headers or None)
+    except requests.exceptions.RequestException:
+        if cached:
+            print(f"{YELLOW}[net]{RESET} /sets unreachable — using cached list from {SETS_CACHE.name}")
+            return cached.get("data", [])
+        raise
+
+    if r.status_code == 304 and cached:
+        return cached.get("data", [])
+
+    data = r.json().get("data", [])
+    _write_sets_cache(data, r.headers.get("ETag"), r.headers.get("Last-Modified"))
+    return data
+
+def _read_sets_cache() -> Optional[dict]:
+    try:
+        return json.loads(SETS_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+def _write_sets_cache(data: List[dict], etag: Optional[str], last_modified: Optional[str]) -> None:
+    if not (etag or last_modified):
+        return  # nothing to revalidate with next time
+    try:
+        SETS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SETS_CACHE.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"etag": etag, "last_modified": last_modified, "data": data}), encoding="utf-8")
+        os.replace(tmp, SETS_CACHE)
+    except OSError:
+        pass  # cache is best-effort
+
+# --- ALL-SETs scopes (menu option -> filter / label) ---
+# Tipos oficiais da Scryfall considerados "jogáveis/normais"
+CURATED_TYPES = frozenset({
+    "core", "expansion", "masters", "eternal", "draft_innovation",
+    "funny", "starter", "commander", "planechase",
+    "archenemy", "duel_deck", "arsenal", "spellbook",
+    "from_the_vault", "premium_deck", "masterpiece", "promo",
+})
+
+def _any_set(s: dict) -> bool:
+    return True
+
+def _not_token(s: dict) -> bool:
+    return s.get("set_type") != "token"
+
+def _is_curated(s: dict) -> bool:
+    return s.get("set_type") in CURATED_TYPES
+
+_SCOPES = {"1": _any_set, "2": _not_token, "3": _is_curated}
+_SCOPE_LABELS = {"1": "ALL (everything)", "2": "All except tokens", "3": "Curated (recommended)"}
+
+# Static menu boxes (built once at import; box() takes any sequence of lines)
+_SCOPE_OPTIONS = (
+    f"{CYAN}1){RESET} Absolutely ALL sets (includes tokens, minigames, memorabilia, etc.)",
+    f"{CYAN}2){RESET} All except tokens",
+    f"{CYAN}3){RESET} Curated (recommended) — playable/normal sets only",
+    f"{CYAN}4){RESET} Back to main menu",
+)
+_SCOPE_BOX = (f"{BRIGHT}Select ALL-SETs scope{RESET}", "") + _SCOPE_OPTIONS
+_FASTCSV_SCOPE_BOX = (f"{BRIGHT}Fast CSV — ALL SETs scope{RESET}", "") + _SCOPE_OPTIONS
+
+_THREADS_BOX = (
+    f"{BRIGHT}Concurrency (threads){RESET}",
+    "",
+    f"Default: {CYAN}24{RESET} (recommended)",
+    "Higher values = faster downloads",
+    "Lower values = more stable on slow/unstable connections",
+    "",
+    "Press ENTER to use the default.",
+)
+
+_FOLDER_POLICY_OPTIONS = (
+    f"  {GREEN}1){RESET} Keep existing files and skip duplicates (fastest)",
+    f"  {YELLOW}2){RESET} Overwrite existing files",
+    f"  {RED}3){RESET} Clean the folder completely and redownload",
+    f"  {CYAN}4){RESET} Back to Main Menu",
+)
+_FOLDER_POLICY_BOX = (
+    f"{BRIGHT}Folder handling for this batch{RESET}",
+    "",
+    "For every SET in this ALL batch:",
+) + _FOLDER_POLICY_OPTIONS
+_SETS_TXT_FOLDER_POLICY_BOX = (
+    f"{BRIGHT}Folder handling for this batch{RESET}",
+    "",
+    "For each SET listed above:",
+) + _FOLDER_POLICY_OPTIONS
+_FASTCSV_FOLDER_POLICY_BOX = (
+    f"{BRIGHT}Folder handling for this Fast CSV batch{RESET}",
+    "",
+    "For every SET:",
+    f"  {CYAN}1){RESET} Keep existing files (recommended / fastest)",
+    f"  {RED}2){RESET} Clean each SET folder before downloading (redownload everything)",
+    f"  {CYAN}3){RESET} Back to main menu",
+)
+
+# (id(sets_meta), scope_key) -> (sets_meta, sorted selection)
+_sorted_sets_cache: Dict[Tuple[int, str], Tuple[List[dict], Tuple[dict, ...]]] = {}
+
+def sorted_sets_by_release(sets_meta: List[dict], scope_key: str) -> Tuple[dict, ...]:
+    """
+    Sets matching the scope filter (_SCOPES), oldest first. Cached per sets list + scope so ALL-SETs
+    menus don't re-filter and re-sort on every entry.
+    """
+    key = (id(sets_meta), scope_key)
+    hit = _sorted_sets_cache.get(key)
+    if hit is not None and hit[0] is sets_meta:
+        return hit[1]
+    filt = _SCOPES[scope_key]
+    selected = tuple(sorted(
+        (s for s in sets_meta if filt(s)),
+        key=lambda x: x.get("released_at") or "1900-01-01",
+    ))
+    _sorted_sets_cache[key] = (sets_meta, selected)
+    return selected
 
 def get_set_meta(code: str) -> dict:
-    return scry_get_json(f"{SCRYFALL_API}/sets/{code.lower()}")
+    return _get_set_meta_cached((code or "").lower())
+
+@functools.lru_cache(maxsize=4096)
+def _get_set_meta_cached(code: str) -> dict:
+    return scry_get_json(f"{SCRYFALL_API}/sets/{code}")
+
+def lookup_set_meta(sets_meta: List[dict], code: str) -> dict:
+    """
+    Find a set in the bulk /sets list (by code, mtgo_code or arena_code).
+    Returns {} when not found; callers fall back to get_set_meta only if needed.
+    """
+    c = (code or "").strip().lower()
+    if not c:
+        return {}
+    return _set_index(sets_meta).by_code.get(c, {})
+
+SET_ALIASES = {
+    "quarta edicao": "4ed", "quarta edição": "4ed", "quarta": "4ed",
+    "quinta edicao": "5ed", "quinta edição": "5ed", "quinta": "5ed",
+    "sexta edicao": "6ed", "sexta edição": "6ed", "sexta": "6ed",
+    "setima edicao": "7ed", "sétima edição": "7ed", "setima": "7ed", "sétima": "7ed",
+    "oitava edicao": "8ed", "oitava edição": "8ed", "oitava": "8ed",
+    "nona edicao": "9ed", "nona edição": "9ed", "nona": "9ed",
+    "decima edicao": "10e", "décima edição": "10e", "decima": "10e", "décima": "10e",
+}
+
+class _SetIndex(NamedTuple):
+    by_code: Dict[str, dict]     # code / mtgo_code / arena_code (lowercase) -> set; code wins over the others
+    names: List[str]             # accent-stripped lowercase names, same order as sets_meta
+    codes: List[str]             # lowercase codes, same order as sets_meta
+    name_pos: Dict[str, int]     # first position of each name
+    code_pos: Dict[str, int]     # first position of each code
+    by_name: Dict[str, dict]     # lowercase name (accents kept) -> first set with it
+
+# id(sets_meta) -> (sets_meta, index); identity-checked like _sorted_sets_cache
+_set_index_cache: Dict[int, Tuple[List[dict], _SetIndex]] = {}
+
+def _set_index(sets_meta: List[dict]) -> _SetIndex:
+    """Lookup tables for code matching and difflib, built once per sets list instead of per query."""
+    hit = _set_index_cache.get(id(sets_meta))
+    if hit is not None and hit[0] is sets_meta:
+        return hit[1]
+    by_code: Dict[str, dict] = {}
+    for key in ("code", "mtgo_code", "arena_code"):
+        for s in sets_meta:
+            c = (s.get(key) or "").lower()
+            if c:
+                by_code.setdefault(c, s)
+    names = [strip_accents((s.get("name") or "").lower()) for s in sets_meta]
+    codes = [(s.get("code") or "").lower() for s in sets_meta]
+    name_pos: Dict[str, int] = {}
+    code_pos: Dict[str, int] = {}
+    for i, n in enumerate(names):
+        name_pos.setdefault(n, i)
+    for i, c in enumerate(codes):
+        code_pos.setdefault(c, i)
+    by_name: Dict[str, dict] = {}
+    for s in sets_meta:
+        by_name.setdefault((s.get("name") or "").lower(), s)
+    idx = _SetIndex(by_code, names, codes, name_pos, code_pos, by_name)
+    _set_index_cache[id(sets_meta)] = (sets_meta, idx)
+    return idx
 
 def fuzzy_match_set(user_text: str, sets_meta: List[dict]) -> Optional[dict]:
     raw = user_text.strip()
     lower = raw.lower()
     noacc = strip_accents(lower)
 
-    aliases = {
-        "quarta edicao": "4ed", "quarta edição": "4ed", "quarta": "4ed",
-        "quinta edicao": "5ed", "quinta edição": "5ed", "quinta": "5ed",
-        "sexta edicao": "6ed", "sexta edição": "6ed", "sexta": "6ed",
-        "setima edicao": "7ed", "sétima edição": "7ed", "setima": "7ed", "sétima": "7ed",
-        "oitava edicao": "8ed", "oitava edição": "8ed", "oitava": "8ed",
-        "nona edicao": "9ed", "nona edição": "9ed", "nona": "9ed",
-        "decima edicao": "10e", "décima edição": "10e", "decima": "10e", "décima": "10e",
-    }
-    if noacc in aliases:
-        lower = aliases[noacc]
-        noacc = aliases[noacc]
+    if noacc in SET_ALIASES:
+        lower = SET_ALIASES[noacc]
+        noacc = SET_ALIASES[noacc]
 
-    for s in sets_meta:
-        if lower == (s.get("code") or "").lower(): return s
-        if lower == (s.get("mtgo_code") or "").lower(): return s
-        if lower == (s.get("arena_code") or "").lower(): return s
+    fx = _set_index(sets_meta)
+    hit = fx.by_code.get(lower)
+    if hit is not None:
+        return hit
 
-    names = [strip_accents((s.get("name") or "").lower()) for s in sets_meta]
-    best = difflib.get_close_matches(noacc, names, n=1, cutoff=0.7)
+    best = difflib.get_close_matches(noacc, fx.names, n=1, cutoff=0.7)
     if best:
-        idx = names.index(best[0]); return sets_meta[idx]
+        return sets_meta[fx.name_pos[best[0]]]
 
-    codes = [(s.get("code") or "").lower() for s in sets_meta]
-    bestc = difflib.get_close_matches(lower, codes, n=1, cutoff=0.6)
+    bestc = difflib.get_close_matches(lower, fx.codes, n=1, cutoff=0.6)
     if bestc:
-        idx = codes.index(bestc[0]); return sets_meta[idx]
+        return sets_meta[fx.code_pos[bestc[0]]]
 
     return None
 
-def scry_search_cards_for_set(set_code: str) -> List[dict]:
-    """Return 'prints' (no art dedupe) + extras/variations."""
-    cards: List[dict] = []
-    q = f"e:{set_code}"
-    page = 1
+# ---------- Bulk data (big ALL SETs batches) ----------
+# Scryfall publishes every print daily as one "default_cards" file. Big batches fetch it once,
+# split it into per-set shards on disk, and answer set searches from there instead of paging
+# /cards/search for every set. The shards are reused until Scryfall publishes a newer file.
+BULK_DIR = SETS_CACHE.parent / "bulk"
+BULK_MIN_SETS = 25        # batches with at least this many sets use bulk data
+BULK_FLUSH_LINES = 200    # per-set lines buffered before appending to its shard
+_bulk_ready = False
 
-    while True:
-        url = f"{SCRYFALL_API}/cards/search"
-        params = {
-            "q": q,
-            "order": "set",
-            "dir": "asc",
-            "unique": "prints",
-            "include_extras": "true",
-            "include_variations": "true",
-            "page": str(page),
-        }
+def _bulk_shard(code: str) -> Path:
+    # prefixed: a bare "con.jsonl" is a reserved name on Windows
+    return BULK_DIR / f"set_{code.lower()}.jsonl"
 
-        try:
-            js = scry_get_json(url, params=params)
-        except requests.exceptions.HTTPError as e:
-            # Alguns sets podem retornar 404 (ou query sem resultados em certos casos)
-            resp = getattr(e, "response", None)
-            if resp is not None and resp.status_code == 404:
-                break
-            raise  # outros erros: deixa propagar (ou trata no batch loop)
+def _split_bulk_file(raw_path: Path) -> None:
+    """
+    Scryfall bulk files hold one card object per line, so they can be split without
+    loading the whole file: each line is appended (buffered) to its set's .jsonl shard.
+    """
+    buffers: Dict[str, List[str]] = {}
+
+    def flush(code: str) -> None:
+        with open(_bulk_shard(code), "a", encoding="utf-8") as f:
+            f.write("\n".join(buffers.pop(code)) + "\n")
+
+    with open(raw_path, "r", encoding="utf-8") as src:
+        for line in src:
+            line = line.strip().rstrip(",")
+            if not line.startswith("{"):
+                continue  # the enclosing [ ]
+            code = (json.loads(line).get("set") or "").lower()
+            if not code:
+                continue
+            buf = buffers.setdefault(code, [])
+            buf.append(line)
+            if len(buf) >= BULK_FLUSH_LINES:
+                flush(code)
+    for code in list(buffers):
+        flush(code)
+
+def prepare_bulk_index() -> bool:
+    """
+    Make sure the per-set shards match Scryfall's current default_cards file.
+    Returns False (and searches keep using the API) if anything goes wrong.
+    """
+    global _bulk_ready
+    try:
+        meta = scry_get_json(f"{SCRYFALL_API}/bulk-data/default-cards")
+        stamp = meta.get("updated_at") or ""
+        marker = BULK_DIR / "_updated_at.txt"
+        if stamp and marker.exists() and marker.read_text(encoding="utf-8") == stamp:
+            _bulk_ready = True
+            return True
 
-        cards.extend(js.get("data", []))
-        if not js.get("has_more", False):
-            break
-        page += 1
+        print(f"{CYAN}[bulk]{RESET} Downloading Scryfall bulk data (one file for every set)...")
+        ensure_dir(BULK_DIR)
+        clear_directory(BULK_DIR)
+        raw_path = BULK_DIR.parent / "default-cards.json"
+        download_to_file_with_retry(meta["download_uri"], raw_path)
+        _split_bulk_file(raw_path)
+        raw_path.unlink()
+        marker.write_text(stamp, encoding="utf-8")
+        _bulk_ready = True
+    except (requests.exceptions.RequestException, OSError, ValueError, KeyError) as e:
+        print(f"{YELLOW}[bulk]{RESET} Bulk data unavailable, using per-set search instead — {e}")
+        _bulk_ready = False
+    return _bulk_ready
+
+def finish_bulk_batch() -> None:
+    """
+    End of the batch that called prepare_bulk_index: later searches go back to the API,
+    so the shards are never trusted without re-checking Scryfall's updated_at marker.
+    """
+    global _bulk_ready
+    _bulk_ready = False
+
+_LEADING_DIGITS = re.compile(r"\d+")
+
+def _collector_key(card: dict) -> Tuple[int, int, str]:
+    # numeric part first (2 < 10), then the raw number for suffixes like 12a / 12★
+    cn = card.get("collector_number") or ""
+    m = _LEADING_DIGITS.match(cn)
+    return (0, int(m.group()), cn) if m else (1, 0, cn)
+
+def _bulk_cards_for_set(set_code: str) -> Optional[List[dict]]:
+    """Cards of one set from its shard, in collector-number order; None if there is no shard."""
+    try:
+        with open(_bulk_shard(set_code), "r", encoding="utf-8") as f:
+            cards = [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return None
+    cards.sort(key=_collector_key)
+    return cards
+
+def _search_set_page(set_code: str, page: int) -> Optional[dict]:
+    """One /cards/search page for a set; None on 404 (empty / unknown set)."""
+    params = {
+        "q": f"e:{set_code}",
+        "order": "set",
+        "dir": "asc",
+        "unique": "prints",
+        "include_extras": "true",
+        "include_variations": "true",
+        "page": str(page),
+    }
+    try:
+        return scry_get_json(f"{SCRYFALL_API}/cards/search", params=params)
+    except requests.exceptions.HTTPError as e:
+        # Alguns sets podem retornar 404 (ou query sem resultados em certos casos)
+        resp = getattr(e, "response", None)
+        if resp is not None and resp.status_code == 404:
+            return None
+        raise  # outros erros: deixa propagar (ou trata no batch loop)
 
+def scry_search_cards_for_set(set_code: str) -> List[dict]:
+    """
+    Return 'prints' (no art dedupe) + extras/variations.
+    Served from the bulk shards when a big batch prepared them (prepare_bulk_index).
+    Otherwise page 1 gives total_cards, so pages 2..N are requested together (still paced by API_LIMITER).
+    """
+    if _bulk_ready:
+        bulk = _bulk_cards_for_set(set_code)
+        if bulk is not None:
+            return bulk
+
+    first = _search_set_page(set_code, 1)
+    if first is None:
+        return []
+    cards: List[dict] = list(first.get("data", []))
+    if not first.get("has_more", False):
+        return cards
+
+    total = first.get("total_cards")
+    if not isinstance(total, int):
+        # No page count to plan with: follow has_more one page at a time
+        page, js = 1, first
+        while js is not None and js.get("has_more", False):
+            page += 1
+            js = _search_set_page(set_code, page)
+            if js is not None:
+                cards.extend(js.get("data", []))
+        return cards
+
+    last_page = -(-total // SEARCH_PAGE_SIZE)
+    with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as pool:
+        pages = pool.map(lambda n: _search_set_page(set_code, n), range(2, last_page + 1))
+        for js in pages:  # map() keeps page order
+            if js is not None:
+                cards.extend(js.get("data", []))
     return cards
 
 def display_name_for_single_image(card: dict) -> str:
@@ -426,6 +912,34 @@ class ImgEntry(NamedTuple):
     name: str
     rotate: Optional[str] = None  # None | "h90" | "rot180"
 
+def _from_uris(uris: dict) -> Optional[str]:
+    if not uris:
+        return None
+    return uris.get("large") or uris.get("png") or uris.get("normal") or uris.get("small")
+
+def _entries_single_named(card: dict, u: str) -> List[ImgEntry]:
+    # split/aftermath (concatenated name) and adventure (main face)
+    return [ImgEntry(u, display_name_for_single_image(card), None)]
+
+def _entries_default(card: dict, u: str) -> List[ImgEntry]:
+    return [ImgEntry(u, (card.get("name") or "Unknown").strip(), None)]
+
+def _entries_flip(card: dict, u: str) -> List[ImgEntry]:
+    faces = card.get("card_faces") or []
+    if not faces:
+        return _entries_default(card, u)
+    face1 = (faces[0].get("name") or card.get("name") or "Unknown").strip()
+    face2 = (faces[1].get("name") or card.get("name") or "Unknown").strip()
+    return [ImgEntry(u, face1, None), ImgEntry(u, face2, "rot180")]
+
+# layout -> handler(card, url) for cards with top-level image_uris
+_LAYOUT_HANDLERS = {
+    "split": _entries_single_named,
+    "aftermath": _entries_single_named,
+    "adventure": _entries_single_named,
+    "flip": _entries_flip,
+}
+
 def pick_image_entries(card: dict) -> List[ImgEntry]:
     """
     Layout rules:
@@ -435,53 +949,31 @@ def pick_image_entries(card: dict) -> List[ImgEntry]:
           * others -> 1 file with card['name']
       - card_faces with image_uris -> 1 file per face (DFC etc.)
     """
-    def from_uris(uris: dict) -> Optional[str]:
-        if not uris:
-            return None
-        return uris.get("large") or uris.get("png") or uris.get("normal") or uris.get("small")
-
-    entries: List[ImgEntry] = []
-    layout = (card.get("layout") or "").lower()
-
     if card.get("image_uris"):
-        u = from_uris(card["image_uris"])
+        u = _from_uris(card["image_uris"])
         if not u:
-            return entries
-
-        if layout in {"split", "aftermath"}:
-            name = display_name_for_single_image(card)
-            entries.append(ImgEntry(u, name, None))
-            return entries
-        
-        if layout == "adventure":
-            name = display_name_for_single_image(card)  # Main Face
-            entries.append(ImgEntry(u, name, None))
-            return entries
-
-        if layout == "flip":
-            faces = card.get("card_faces") or []
-            if faces:
-                face1 = (faces[0].get("name") or card.get("name") or "Unknown").strip()
-                face2 = (faces[1].get("name") or card.get("name") or "Unknown").strip()
-                entries.append(ImgEntry(u, face1, None))
-                entries.append(ImgEntry(u, face2, "rot180"))
-                return entries
-
-        entries.append(ImgEntry(u, (card.get("name") or "Unknown").strip(), None))
-        return entries
+            return []
+        layout = (card.get("layout") or "").lower()
+        handler = _LAYOUT_HANDLERS.get(layout, _entries_default)
+        return handler(card, u)
 
+    entries: List[ImgEntry] = []
     for face in (card.get("card_faces") or []):
-        face_url = from_uris(face.get("image_uris", {}))
+        face_url = _from_uris(face.get("image_uris", {}))
         if face_url:
             face_name = (face.get("name") or card.get("name") or "Unknown").strip()
             entries.append(ImgEntry(face_url, face_name, None))
     return entries
 
+HORIZONTAL_LAYOUTS = frozenset({"split", "aftermath", "flip"})
+
+def is_horizontal_layout(card: Optional[dict]) -> bool:
+    """Metadata-only half of the rotation check (no image needed)."""
+    return bool(card) and (card.get("layout") or "").lower() in HORIZONTAL_LAYOUTS
+
 def should_rotate_h90(card: dict, img: Image.Image) -> bool:
-    layout = (card.get("layout") or "").lower()
-    horizontal_layouts = {"split", "aftermath", "flip"}
     w, h = img.size
-    return (w > h) and (layout in horizontal_layouts)
+    return (w > h) and is_horizontal_layout(card)
 
 def infer_ext_from_url(url: str) -> str:
     return ".png" if ".png" in url.lower() else ".jpg"
@@ -492,18 +984,20 @@ def save_image(content: bytes, out_path: Path, card=None, rotate_mode: Optional[
     - rotate_mode None → if horizontal (split/aftermath/flip), rotate 90° and force .jpg
     - otherwise save as-is
     """
-    if rotate_mode or card:
+    # Only rot180 entries and split/aftermath/flip layouts can need PIL; everything else is written as-is
+    if rotate_mode or is_horizontal_layout(card):
         try:
             img = Image.open(BytesIO(content))
+            # transpose = exact pixel reorder (no resampling path); no optimize=True (2nd Huffman pass)
             if rotate_mode == "rot180":
-                img = img.rotate(180, expand=True)
+                img = img.transpose(Image.Transpose.ROTATE_180)
                 rgb = img.convert("RGB")
-                rgb.save(out_path.with_suffix(".jpg"), quality=95, subsampling=0, optimize=True)
+                rgb.save(out_path.with_suffix(".jpg"), quality=JPEG_QUALITY, subsampling=JPEG_SUBSAMPLING)
                 return
             if should_rotate_h90(card, img):
-                img = img.rotate(90, expand=True)
+                img = img.transpose(Image.Transpose.ROTATE_90)
                 rgb = img.convert("RGB")
-                rgb.save(out_path.with_suffix(".jpg"), quality=95, subsampling=0, optimize=True)
+                rgb.save(out_path.with_suffix(".jpg"), quality=JPEG_QUALITY, subsampling=JPEG_SUBSAMPLING)
                 return
         except Exception:
             pass
@@ -527,6 +1021,19 @@ def printed_name_set_menu(base_dir: Path):
 
 # ---------- FAST CSV DOWNLOADER (Experimental) ----------
 
+class _NullSink:
+    """Discards everything written to it (quiet mode without buffering the output)."""
+    def write(self, s: str) -> int:
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+_NULL = _NullSink()
+
 def fastcsv_set_menu(base_dir: Path):
     """
     Fast CSV SET Downloader — Experimental
@@ -620,28 +1127,15 @@ def fastcsv_set_menu(base_dir: Path):
         expected = chosen.get("card_count") or chosen.get("printed_size") or "—"
 
         try:
-            total_regs, _ = scry_search_cards_for_set_cached(chosen["code"])
+            total_regs = scry_search_count_for_set(chosen["code"])
         except Exception:
             total_regs = "—"
 
         # -------- Threads --------
-        box([
-            f"{BRIGHT}Concurrency (threads){RESET}",
-            "",
-            f"Default: {CYAN}24{RESET} (recommended)",
-            "Higher values = faster downloads",
-            "Lower values = more stable on slow/unstable connections",
-            "",
-            "Press ENTER to use the default.",
-        ], color=YELLOW)
+        box(_THREADS_BOX, color=YELLOW)
 
-        raw = input(BRIGHT + "Threads: " + RESET).strip()
-        try:
-            threads = int(raw) if raw else 24
-            if threads < 1:
-                threads = 24
-        except Exception:
-            threads = 24
+        threads = prompt_threads()
+        ensure_pool_size(threads)
 
         root = base_dir.parent
         manifest_path, out_dir = fcsv.default_paths(root, set_code)
@@ -660,9 +1154,8 @@ def fastcsv_set_menu(base_dir: Path):
             f"Folder:   {CYAN}{out_dir}{RESET}",
         ], color=YELLOW)
 
-        import io, time as _time, contextlib
+        import time as _time, contextlib
         start = _time.time()
-        buf = io.StringIO()
 
         try:
             out_dir.mkdir(parents=True, exist_ok=True)
@@ -675,17 +1168,14 @@ def fastcsv_set_menu(base_dir: Path):
                 print(f"\n{CYAN}[fast]{RESET} Using existing manifest: {manifest_path.name} (rows={total_rows})")
             else:
                 print(f"\n{CYAN}[fast]{RESET} Building manifest for {set_code}...")
-                with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+                with contextlib.redirect_stdout(_NULL), contextlib.redirect_stderr(_NULL):
                     rows = fcsv.build_manifest_for_set(set_code, manifest_path)
                 total_rows = len(rows)
                 print(f"{CYAN}[fast]{RESET} Manifest created: {manifest_path.name} (rows={total_rows})")
 
             # Pending = missing files
-            missing_before = []
-            for r in rows:
-                fp = out_dir / r.target_filename
-                if not (fp.exists() and fp.stat().st_size > 0):
-                    missing_before.append(r)
+            idx = _index_dir(out_dir)
+            missing_before = [r for r in rows if idx.get(r.target_filename, 0) <= 0]
 
             pending = len(missing_before)
             already_done = total_rows - pending
@@ -693,7 +1183,7 @@ def fastcsv_set_menu(base_dir: Path):
 
             if pending > 0:
                 print(f"{CYAN}[fast]{RESET} Downloading images (pending: {pending})...")
-                with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+                with contextlib.redirect_stdout(_NULL), contextlib.redirect_stderr(_NULL):
                     fcsv.run_download(manifest_path, out_dir, threads)
             else:
                 print(f"{CYAN}[fast]{RESET} Nothing missing on disk. Skipping download.")
@@ -714,11 +1204,8 @@ def fastcsv_set_menu(base_dir: Path):
         elapsed = _time.time() - start
 
         # -------- Final summary --------
-        missing_after = []
-        for r in rows:
-            fp = out_dir / r.target_filename
-            if not (fp.exists() and fp.stat().st_size > 0):
-                missing_after.append(r)
+        idx = _index_dir(out_dir)
+        missing_after = [r for r in rows if idx.get(r.target_filename, 0) <= 0]
 
         done_total = total_rows - len(missing_after)
         downloaded_new = max(0, done_total - already_done)
@@ -727,7 +1214,7 @@ def fastcsv_set_menu(base_dir: Path):
         errors = 0
         try:
             state_path = manifest_path.with_suffix(".state.jsonl")
-            state_map = fcsv.load_state_done(state_path)
+            state_map = load_state_cached(state_path)
             errors = sum(1 for v in state_map.values() if str(v).lower() == "failed")
         except Exception:
             errors = 0
@@ -755,6 +1242,68 @@ def fastcsv_set_menu(base_dir: Path):
 
 # ---------- UtilHelper Menu ----------
 
+_INT_RE = re.compile(r"^\d+$")
+_OPT_1_3 = frozenset({"1", "2", "3"})
+_OPT_1_4 = frozenset({"1", "2", "3", "4"})
+
+def prompt_choice(msg: str, allowed, shortcuts: Optional[Dict[str, str]] = None,
+                  error: str = RED + "Invalid option, try again." + RESET) -> str:
+    """
+    Ask until the (lowercased) answer is in allowed or is a shortcut.
+    Returns the choice (shortcuts are mapped to their target).
+    """
+    while True:
+        raw = input(BRIGHT + msg + RESET).strip().lower()
+        if shortcuts and raw in shortcuts:
+            return shortcuts[raw]
+        if raw in allowed:
+            return raw
+        print(error)
+
+def prompt_threads(default: int = 24, max_threads: int = 256) -> int:
+    """Threads prompt: ENTER / non-numeric / 0 => default; capped at max_threads."""
+    raw = input(BRIGHT + "Threads: " + RESET).strip()
+    if not _INT_RE.match(raw) or int(raw) < 1:
+        return default
+    return min(max_threads, int(raw))
+
+def prompt_exist_mode(clean_warning: str) -> Optional[str]:
+    """
+    Options 1-4 of the folder-handling boxes:
+    'skip' | 'overwrite' | 'clean' (after confirmation) | None (back to main menu)
+    """
+    while True:
+        c = prompt_choice("Choose an option [1-4]: ", _OPT_1_4,
+                          error=RED + "Invalid option. Please enter 1, 2, 3 or 4." + RESET)
+        if c == "3":
+            confirm = input(BRIGHT + YELLOW + clean_warning + " Proceed? [y/N]: " + RESET).strip().lower()
+            if confirm not in {"y", "yes"}:
+                print(YELLOW + "Cancelled clean. Please choose another option." + RESET)
+                continue
+        return {"1": "skip", "2": "overwrite", "3": "clean", "4": None}[c]
+
+def _prompt_scope(lines: Sequence[str] = _SCOPE_BOX) -> Optional[str]:
+    """ALL-SETs scope mini-menu. Returns a _SCOPES key ('1'..'3') or None for back."""
+    box(lines, color=CYAN)
+    scope = prompt_choice("Your choice [1-4]: ", _OPT_1_4)
+    return None if scope == "4" else scope
+
+def _prompt_folder_policy(allow_overwrite: bool = True,
+                          lines: Optional[Sequence[str]] = None,
+                          clean_warning: str = "This will DELETE all files in each set folder before downloading.",
+                          ) -> Optional[str]:
+    """
+    Batch folder policy: 'skip' | 'overwrite' | 'clean' | None (back).
+    allow_overwrite=False is the Fast CSV variant (keep / clean / back, no confirmation).
+    """
+    if not allow_overwrite:
+        box(lines or _FASTCSV_FOLDER_POLICY_BOX, color=CYAN)
+        mode = prompt_choice("Choose an option [1-3]: ", _OPT_1_3)
+        return {"1": "skip", "2": "clean", "3": None}[mode]
+
+    box(lines or _FOLDER_POLICY_BOX, color=CYAN)
+    return prompt_exist_mode(clean_warning)
+
 def prompt_yes_no(question: str, default_no: bool = True) -> bool:
     """
     Yes/No prompt.
@@ -870,10 +1419,7 @@ def prompt_specific_set(sets_meta: list[dict]) -> dict | None:
         # fallback: search sets_meta
         if not (set_type and rel and expected):
             try:
-                meta_full = next(
-                    (s for s in sets_meta if (s.get("code") or "").lower() == (chosen.get("code") or "").lower()),
-                    {}
-                )
+                meta_full = lookup_set_meta(sets_meta, chosen.get("code") or "")
                 if not set_type:
                     st = meta_full.get("set_type") or ""
                     set_type = st.replace("_", " ").title() if st else ""
@@ -895,7 +1441,7 @@ def prompt_specific_set(sets_meta: list[dict]) -> dict | None:
 
         # Real print quantity
         try:
-            total_regs, _ = scry_search_cards_for_set_cached(chosen["code"])
+            total_regs = scry_search_count_for_set(chosen["code"])
         except Exception:
             total_regs = "—"
 
@@ -1005,6 +1551,27 @@ def singles_menu(base_dir: Path):
     # Open SingleCard module menu (UI to search name, list prints, choose ONE/ALL)
     sc.singlecard_menu(base_dir)
 
+@functools.lru_cache(maxsize=1024)
+def _state_done(path_str: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    return fcsv.load_state_done(Path(path_str))
+
+def load_state_cached(state_path: Path) -> Dict[str, str]:
+    """fcsv.load_state_done cached per (path, mtime, size); {} if there is no state file yet."""
+    try:
+        st = state_path.stat()
+    except FileNotFoundError:
+        return {}
+    return _state_done(str(state_path), st.st_mtime_ns, st.st_size)
+
+def _fastcsv_preflight(manifest_path: Path, out_dir: Path) -> Tuple[Optional[List[str]], Dict[str, int]]:
+    """
+    I/O-only prep for one Fast CSV set (safe to run in a worker thread).
+    Returns (target filenames or None if the manifest still has to be built, folder index).
+    Only the filename column is kept, not full ManifestRow objects.
+    """
+    names = list(fcsv.iter_manifest_names(manifest_path)) if manifest_path.exists() else None
+    return names, _index_dir(out_dir)
+
 def fastcsv_all_sets_menu(base_dir: Path):
     """
     Fast CSV ALL SETs — Experimental
@@ -1018,43 +1585,12 @@ def fastcsv_all_sets_menu(base_dir: Path):
     sets_meta = get_all_sets()
 
     # -------- Scope mini-menu --------
-    box([
-        f"{BRIGHT}Fast CSV — ALL SETs scope{RESET}",
-        "",
-        f"{CYAN}1){RESET} Absolutely ALL sets (includes tokens, minigames, memorabilia, etc.)",
-        f"{CYAN}2){RESET} All except tokens",
-        f"{CYAN}3){RESET} Curated (recommended) — playable/normal sets only",
-        f"{CYAN}4){RESET} Back to main menu"
-    ], color=CYAN)
-
-    while True:
-        scope = input(BRIGHT + "Your choice [1-4]: " + RESET).strip()
-        if scope in {"1", "2", "3", "4"}:
-            break
-        print(RED + "Invalid option, try again." + RESET)
-
-    if scope == "4":
+    scope = _prompt_scope(_FASTCSV_SCOPE_BOX)
+    if scope is None:
         return
 
-    curated_types = {
-        "core", "expansion", "masters", "eternal", "draft_innovation",
-        "funny", "starter", "commander", "planechase",
-        "archenemy", "duel_deck", "arsenal", "spellbook",
-        "from_the_vault", "premium_deck", "masterpiece", "promo"
-    }
-
-    if scope == "1":
-        filt = lambda s: True
-        scope_label = "ALL (everything)"
-    elif scope == "2":
-        filt = lambda s: (s.get("set_type") != "token")
-        scope_label = "All except tokens"
-    else:
-        filt = lambda s: (s.get("set_type") in curated_types)
-        scope_label = "Curated (recommended)"
-
-    selected = [s for s in sets_meta if filt(s)]
-    selected.sort(key=lambda x: x.get("released_at") or "1900-01-01")
+    scope_label = _SCOPE_LABELS[scope]
+    selected = sorted_sets_by_release(sets_meta, scope)
 
     box([
         f"{BRIGHT}Fast CSV — ALL SETs (preview){RESET}",
@@ -1070,43 +1606,17 @@ def fastcsv_all_sets_menu(base_dir: Path):
         return
 
     # -------- Threads (single choice for the whole batch) --------
-    box([
-        f"{BRIGHT}Concurrency (threads){RESET}",
-        "",
-        f"Default: {CYAN}24{RESET} (recommended)",
-        "Higher values = faster downloads",
-        "Lower values = more stable on slow/unstable connections",
-        "",
-        "Press ENTER to use the default.",
-    ], color=YELLOW)
+    box(_THREADS_BOX, color=YELLOW)
 
-    raw = input(BRIGHT + "Threads: " + RESET).strip()
-    try:
-        threads = int(raw) if raw else 24
-        threads = max(1, min(256, threads))
-    except Exception:
-        threads = 24
+    threads = prompt_threads()
+    ensure_pool_size(threads)
 
     # -------- Folder policy --------
-    box([
-        f"{BRIGHT}Folder handling for this Fast CSV batch{RESET}",
-        "",
-        "For every SET:",
-        f"  {CYAN}1){RESET} Keep existing files (recommended / fastest)",
-        f"  {RED}2){RESET} Clean each SET folder before downloading (redownload everything)",
-        f"  {CYAN}3){RESET} Back to main menu"
-    ], color=CYAN)
-
-    while True:
-        mode = input(BRIGHT + "Choose an option [1-3]: " + RESET).strip()
-        if mode in {"1", "2", "3"}:
-            break
-        print(RED + "Invalid option, try again." + RESET)
-
-    if mode == "3":
+    mode = _prompt_folder_policy(allow_overwrite=False)
+    if mode is None:
         return
 
-    clean_each = (mode == "2")
+    clean_each = (mode == "clean")
 
     # -------- Batch loop --------
     total_sets = len(selected)
@@ -1114,10 +1624,25 @@ def fastcsv_all_sets_menu(base_dir: Path):
     fail_sets = 0
 
 
-    import io, contextlib, time as _time
+    import contextlib, time as _time
 
     root = base_dir.parent  # IMPORTANT: keep same contract as fastcsv_set_menu
+    set_paths = [fcsv.default_paths(root, str(s.get("code") or "").upper()) for s in selected]
+
+    # Preflight (manifest read + folder scan) runs ahead in the background while
+    # the current set downloads. Building a missing manifest stays on this thread.
+    prefetch_pool = ThreadPoolExecutor(max_workers=PREFLIGHT_AHEAD)
+    preflights = {}
+
+    def _submit_preflight(j: int) -> None:
+        if j < total_sets and j not in preflights:
+            preflights[j] = prefetch_pool.submit(_fastcsv_preflight, *set_paths[j])
+
+    for j in range(PREFLIGHT_AHEAD):
+        _submit_preflight(j)
+
     for i, s in enumerate(selected, 1):
+        _submit_preflight(i - 1 + PREFLIGHT_AHEAD)
         code = str(s.get("code") or "").upper()
         name = str(s.get("name") or "Unknown")
         released = s.get("released_at") or "—"
@@ -1126,36 +1651,31 @@ def fastcsv_all_sets_menu(base_dir: Path):
 
         # Search results (prints)
         try:
-            total_regs, _ = scry_search_cards_for_set_cached(s.get("code") or "")
+            total_regs = scry_search_count_for_set((s.get("code") or "").lower())
         except Exception:
             total_regs = "—"
 
         # Paths (manifest + output)
-        manifest_path, out_dir = fcsv.default_paths(root, code)
+        manifest_path, out_dir = set_paths[i - 1]
 
         # Build/Read manifest (count rows)
-        buf = io.StringIO()
         start = _time.time()
 
         try:
             out_dir.mkdir(parents=True, exist_ok=True)
             manifest_path.parent.mkdir(parents=True, exist_ok=True)
 
-            if not manifest_path.exists():
+            names, idx = preflights.pop(i - 1).result()
+            if names is None:
                 print(f"\n{CYAN}[fastcsv]{RESET} Building manifest for {code}...")
-                with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
-                    rows = fcsv.build_manifest_for_set(code, manifest_path)
-            else:
-                rows = fcsv.read_manifest_csv(manifest_path)
+                with contextlib.redirect_stdout(_NULL), contextlib.redirect_stderr(_NULL):
+                    names = [r.target_filename for r in fcsv.build_manifest_for_set(code, manifest_path)]
+                mark_http()
 
-            total_rows = len(rows)
+            total_rows = len(names)
 
             # Pending = missing files
-            missing_before = []
-            for r in rows:
-                fp = out_dir / r.target_filename
-                if not (fp.exists() and fp.stat().st_size > 0):
-                    missing_before.append(r)
+            missing_before = [n for n in names if idx.get(n, 0) <= 0]
 
             pending = len(missing_before)
             already_done = total_rows - pending
@@ -1179,7 +1699,7 @@ def fastcsv_all_sets_menu(base_dir: Path):
             # Optional clean (if user chose clean_each)
             if clean_each and out_dir.exists():
                 try:
-                    shutil.rmtree(out_dir)
+                    discard_dir_in_background(out_dir)
                     out_dir.mkdir(parents=True, exist_ok=True)
                     # after cleaning, everything becomes pending
                     pending = total_rows
@@ -1191,8 +1711,9 @@ def fastcsv_all_sets_menu(base_dir: Path):
             # Download if needed (quiet mode)
             if pending > 0:
                 print(f"{CYAN}[fastcsv]{RESET} Downloading images (pending: {pending})...")
-                with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+                with contextlib.redirect_stdout(_NULL), contextlib.redirect_stderr(_NULL):
                     fcsv.run_download(manifest_path, out_dir, threads=threads)
+                mark_http()
             else:
                 print(f"{CYAN}[fastcsv]{RESET} Nothing missing on disk. Skipping download.")
 
@@ -1207,31 +1728,35 @@ def fastcsv_all_sets_menu(base_dir: Path):
                 f"Manifest: {manifest_path}",
                 f"Folder:   {out_dir}",
             ], color=RED)
-            time.sleep(0.5)
+            pause_since_last_http(SET_MIN_GAP)
             continue
 
         elapsed = _time.time() - start
 
         # ---- Final summary per set (green box like single) ----
         try:
-            # recompute missing after
-            missing_after = []
-            for r in rows:
-                fp = out_dir / r.target_filename
-                if not (fp.exists() and fp.stat().st_size > 0):
-                    missing_after.append(r)
+            if pending == 0:
+                # Nothing was downloaded: the preflight scan already is the final state
+                done_total = total_rows
+                downloaded_new = 0
+                skipped = total_rows
+                errors = 0
+            else:
+                # recompute missing after
+                idx = _index_dir(out_dir)
+                missing_after = [n for n in names if idx.get(n, 0) <= 0]
 
-            done_total = total_rows - len(missing_after)
-            downloaded_new = max(0, done_total - already_done)
-            skipped = already_done  # what was already on disk before this run
+                done_total = total_rows - len(missing_after)
+                downloaded_new = max(0, done_total - already_done)
+                skipped = already_done  # what was already on disk before this run
 
-            errors = 0
-            try:
-                state_path = manifest_path.with_suffix(".state.jsonl")
-                state_map = fcsv.load_state_done(state_path)
-                errors = sum(1 for v in state_map.values() if str(v).lower() == "failed")
-            except Exception:
                 errors = 0
+                try:
+                    state_path = manifest_path.with_suffix(".state.jsonl")
+                    state_map = load_state_cached(state_path)
+                    errors = sum(1 for v in state_map.values() if str(v).lower() == "failed")
+                except Exception:
+                    errors = 0
 
             avg_speed = (downloaded_new / elapsed) if elapsed > 0 else 0.0
 
@@ -1254,8 +1779,10 @@ def fastcsv_all_sets_menu(base_dir: Path):
             ok_sets += 1
             print(YELLOW + f"[fastcsv] Summary warning for {code}: {e}" + RESET)
 
-        # gentle pause between sets
-        time.sleep(0.5)
+        # gentle pause between sets (only if we just hit the network)
+        pause_since_last_http(SET_MIN_GAP)
+
+    prefetch_pool.shutdown(wait=False, cancel_futures=True)
 
     box([
         f"{BRIGHT}Fast CSV — ALL SETs completed{RESET}",
@@ -1271,60 +1798,43 @@ def fastcsv_all_sets_menu(base_dir: Path):
     input("\nPress ENTER to return to the main menu...")
 
 
-def prompt_main_menu() -> str:
-    lines = [
-        f"{BRIGHT}Main Menu{RESET}",
-        "",
-        f"{BRIGHT}{CYAN}SET downloads{RESET}",
-        f"{CYAN} 1){RESET} Download a specific SET   {YELLOW}(recommended){RESET}",
-        f"{CYAN} 2){RESET} Download ALL SETs         {YELLOW}(big / slower){RESET}",
-        f"{CYAN} 3){RESET} Download SETs from Sets.txt",
-        "",
-        f"{BRIGHT}{CYAN}Tools{RESET}",
-        f"{CYAN} 4){RESET} Download TOKENS from Forge Audit   {YELLOW}(tokens only){RESET}",
-        f"{CYAN} 5){RESET} Download Singles (one card / all prints)",
-        f"{CYAN} 6){RESET} Download CARDS from Forge Audit    {YELLOW}(not tokens){RESET}",
-        "",
-        f"{BRIGHT}{CYAN}Advanced{RESET}",
-        f"{CYAN} 7){RESET} {YELLOW}[Experimental]{RESET} Printed/Flavor-name SET downloader  {YELLOW}(SLD-friendly){RESET}",
-        f"{CYAN} 8){RESET} {YELLOW}[Experimental]{RESET} Fast SET downloader  {YELLOW}(ultra fast / resume){RESET}",
-        f"{CYAN} 9){RESET} {YELLOW}[Experimental]{RESET} Fast ALL SETs  {YELLOW}(ultra fast / resume){RESET}",
-        "",
-        f"{CYAN} 0){RESET} Exit",
-        "",
-    ]
-
-    box(lines, color=CYAN)
-
-    shortcuts = {
-        "s": "1",
-        "a": "2",
-        "t": "4",
-        "p": "5",
-        "q": "0",
-        "x": "0",
-    }
-
-    valid = {str(i) for i in range(0, 10)}
+_MAIN_MENU_BOX = (
+    f"{BRIGHT}Main Menu{RESET}",
+    "",
+    f"{BRIGHT}{CYAN}SET downloads{RESET}",
+    f"{CYAN} 1){RESET} Download a specific SET   {YELLOW}(recommended){RESET}",
+    f"{CYAN} 2){RESET} Download ALL SETs         {YELLOW}(big / slower){RESET}",
+    f"{CYAN} 3){RESET} Download SETs from Sets.txt",
+    "",
+    f"{BRIGHT}{CYAN}Tools{RESET}",
+    f"{CYAN} 4){RESET} Download TOKENS from Forge Audit   {YELLOW}(tokens only){RESET}",
+    f"{CYAN} 5){RESET} Download Singles (one card / all prints)",
+    f"{CYAN} 6){RESET} Download CARDS from Forge Audit    {YELLOW}(not tokens){RESET}",
+    "",
+    f"{BRIGHT}{CYAN}Advanced{RESET}",
+    f"{CYAN} 7){RESET} {YELLOW}[Experimental]{RESET} Printed/Flavor-name SET downloader  {YELLOW}(SLD-friendly){RESET}",
+    f"{CYAN} 8){RESET} {YELLOW}[Experimental]{RESET} Fast SET downloader  {YELLOW}(ultra fast / resume){RESET}",
+    f"{CYAN} 9){RESET} {YELLOW}[Experimental]{RESET} Fast ALL SETs  {YELLOW}(ultra fast / resume){RESET}",
+    "",
+    f"{CYAN} 0){RESET} Exit",
+    "",
+)
+
+_MAIN_SHORTCUTS = {"s": "1", "a": "2", "t": "4", "p": "5", "q": "0", "x": "0"}
+_MAIN_VALID = frozenset(str(i) for i in range(0, 10))
+_MAIN_MENU_ERROR = (
+    f"{RED}Invalid option.{RESET} "
+    f"{YELLOW}Use 0–9 or shortcuts:{RESET} "
+    f"{CYAN}s{RESET}=SET, "
+    f"{CYAN}a{RESET}=ALL, "
+    f"{CYAN}t{RESET}=TOKENS, "
+    f"{CYAN}p{RESET}=SINGLES, "
+    f"{CYAN}q{RESET}=EXIT (0)."
+)
 
-    while True:
-        raw = input(BRIGHT + "Your choice [0-9]: " + RESET).strip().lower()
-
-        if raw in shortcuts:
-            return shortcuts[raw]
-
-        if raw in valid:
-            return raw
-
-        print(
-            f"{RED}Invalid option.{RESET} "
-            f"{YELLOW}Use 0–9 or shortcuts:{RESET} "
-            f"{CYAN}s{RESET}=SET, "
-            f"{CYAN}a{RESET}=ALL, "
-            f"{CYAN}t{RESET}=TOKENS, "
-            f"{CYAN}p{RESET}=SINGLES, "
-            f"{CYAN}q{RESET}=EXIT (0)."
-        )
+def prompt_main_menu() -> str:
+    box(_MAIN_MENU_BOX, color=CYAN)
+    return prompt_choice("Your choice [0-9]: ", _MAIN_VALID, _MAIN_SHORTCUTS, error=_MAIN_MENU_ERROR)
 
 
 def prompt_set_code(sets_meta: List[dict]) -> dict:
@@ -1355,59 +1865,36 @@ def prompt_existing_set_dir_action(set_dir: Path) -> Optional[str]:
         f"  {CYAN}4){RESET} Back to Main Menu",
     ], color=YELLOW)
 
-    while True:
-        c = input(BRIGHT + "Choose an option [1-4]: " + RESET).strip()
-        if c == "1":
-            return "skip"
-        if c == "2":
-            return "overwrite"
-        if c == "3":
-            confirm = input(
-                BRIGHT + YELLOW +
-                "This will DELETE all files in this set folder. Proceed? [y/N]: " +
-                RESET
-            ).strip().lower()
-            if confirm in {"y", "yes"}:
-                return "clean"
-            else:
-                print(YELLOW + "Cancelled clean. Please choose another option." + RESET)
-                continue
-        if c == "4":
-            return None
-        print(RED + "Invalid option. Please enter 1, 2, 3 or 4." + RESET)
+    return prompt_exist_mode("This will DELETE all files in this set folder.")
 
 # ---------- Sets.txt Batch  ----------
 
-def load_sets_from_file(sets_meta: List[dict], file_path: Path) -> Tuple[List[dict], List[str]]:
-    """
-    Read file with one set per line (code or name),
-    resolve via fuzzy match and return (found, not_found).
-    Blank lines and lines starting with # are ignored.
-    """
+def sets_file_lines(raw_lines: List[str]) -> List[str]:
+    """Useful Sets.txt lines: stripped once, blank lines and # comments dropped."""
+    return [s for s in (ln.strip() for ln in raw_lines) if s and not s.startswith("#")]
+
+def resolve_sets(sets_meta: List[dict], lines: List[str]) -> Tuple[List[dict], List[str]]:
+    """Resolve already-cleaned Sets.txt lines (see sets_file_lines) into (found, not_found)."""
     found: List[dict] = []
     not_found: List[str] = []
-    if not file_path.exists():
-        return found, ["[FILE NOT FOUND] " + str(file_path)]
 
-    lines = file_path.read_text(encoding="utf-8").splitlines()
-    for raw in lines:
-        s = raw.strip()
-        if not s or s.startswith("#"):
-            continue
-        m = fuzzy_match_set(s, sets_meta)
-        if m:
-            found.append(m)
-        else:
-            not_found.append(s)
-    # dedupe preserving order
+    # Exact code/name lookups first (common case); fuzzy match only on misses
+    fx = _set_index(sets_meta)
+    by_code, by_name = fx.by_code, fx.by_name
+
     seen = set()
-    unique_found = []
-    for m in found:
+    for s in lines:
+        key = s.lower()
+        m = by_code.get(key) or by_name.get(key) or fuzzy_match_set(s, sets_meta)
+        if not m:
+            not_found.append(s)
+            continue
+        # dedupe preserving order
         code = (m.get("code") or "").lower()
         if code not in seen:
-            unique_found.append(m)
+            found.append(m)
             seen.add(code)
-    return unique_found, not_found
+    return found, not_found
 
 
 # ---------- Core per SET ----------
@@ -1420,101 +1907,173 @@ def format_duration(seconds: float) -> str:
     return f"{m}m {s:02d}s"
 
 def scry_search_cards_for_set_cached(set_meta_code: str) -> Tuple[int, List[dict]]:
-    # helper if you ever want to cache; for now just passthrough
-    cards = scry_search_cards_for_set(set_meta_code)
+    # Cached per normalized set code (confirm box -> download reuse the same search)
+    cards = _search_cards_for_set_cached((set_meta_code or "").lower())
     return len(cards), cards
 
-def download_set(set_meta: dict, base_dir: Path, exist_mode: str = "skip") -> None:
+@functools.lru_cache(maxsize=16)
+def _search_cards_for_set_cached(code: str) -> List[dict]:
+    # Small on purpose: full card lists are big, keep only the most recent sets
+    return scry_search_cards_for_set(code)
+
+@functools.lru_cache(maxsize=4096)
+def scry_search_count_for_set(set_meta_code: str) -> int:
+    """Search result count only (cheap to keep for every set in ALL-SETs runs)."""
+    total, _ = scry_search_cards_for_set_cached(set_meta_code)
+    return total
+
+def _download_entry(entry: ImgEntry, card: dict, out_path: Path) -> None:
+    """Worker: fetch one image and save it (rotation included). Raises on failure."""
+    if not entry.rotate and not is_horizontal_layout(card):
+        # Nothing for PIL to do: stream straight to the file
+        download_to_file_with_retry(entry.url, out_path)
+        return
+    content = download_bytes_with_retry(entry.url)
+    save_image(
+        content,
+        out_path,
+        card=card,
+        rotate_mode=entry.rotate
+    )
+
+def _iter_downloads(pool: ThreadPoolExecutor, jobs: List[Tuple[ImgEntry, dict, Path]], window: int):
+    """
+    Feed jobs to the pool through a bounded window and yield (future, job) as each one finishes.
+    Only `window` jobs are ever queued, so memory stays flat and an interrupt drops the rest.
+    """
+    it = iter(jobs)
+    pending = {}
+    for job in it:
+        pending[pool.submit(_download_entry, *job)] = job
+        if len(pending) >= window:
+            break
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for fut in done:
+            job = pending.pop(fut)
+            nxt = next(it, None)
+            if nxt is not None:
+                pending[pool.submit(_download_entry, *nxt)] = nxt
+            yield fut, job
+
+class SetPlan(NamedTuple):
+    jobs: List[Tuple[ImgEntry, dict, Path]]   # (entry, card, out_path) still to download
+    skipped: int                              # cards without images + files kept by "skip"
+    log: bytearray                            # [NO_IMAGE] lines; download errors are appended later
+
+def plan_set_downloads(cards: List[dict], set_dir: Path, exist_mode: str) -> SetPlan:
+    """
+    Single pass over the cards that assigns every final file name (Name, Name2, ...)
+    in card order. The numbering no longer depends on which download finishes first,
+    so the jobs can run on the pool without any shared counter.
+    """
+    name_counts: Dict[str, int] = {}
+    jobs: List[Tuple[ImgEntry, dict, Path]] = []
+    skipped = 0
+    log = bytearray()
+
+    # One directory listing instead of an exists() stat per entry ("overwrite" never skips)
+    existing = set() if exist_mode == "overwrite" else set(_index_names(set_dir))
+
+    for card in cards:
+        entries = pick_image_entries(card)
+        if not entries:
+            skipped += 1
+            log += f"[NO_IMAGE] {card.get('name','Unknown')} ({card.get('id')})\n".encode("utf-8")
+            continue
+
+        for entry in entries:
+            base_name = slugify_filename(entry.name)
+            ext = infer_ext_from_url(entry.url)
+
+            cnt = name_counts[base_name] = name_counts.get(base_name, 0) + 1
+            suffix = "" if cnt == 1 else str(cnt)
+            final_name = f"{base_name}{suffix}.fullborder{ext}"
+
+            if final_name in existing:
+                skipped += 1
+                continue
+
+            jobs.append((entry, card, set_dir / final_name))
+
+    return SetPlan(jobs, skipped, log)
+
+def download_set(set_meta: dict, base_dir: Path, exist_mode: str = "skip",
+                 set_dir: Optional[Path] = None) -> None:
+    """
+    Download every image of one SET into set_dir.
+    set_dir defaults to base_dir / safe_set_folder_name(code); callers that already built it pass it in.
+    """
     set_code = (set_meta.get("code") or "").upper()
-    set_dir = base_dir / safe_set_folder_name(set_code)
+    set_dir = set_dir or (base_dir / safe_set_folder_name(set_code))
     ensure_dir(set_dir)
 
-    # Existing folder policy
-    if any(set_dir.iterdir()):
-        if exist_mode == "clean":
-            clear_directory(set_dir)
-            print(YELLOW + "Folder cleaned." + RESET)
+    # Existing folder policy (only "clean" needs to look inside the folder)
+    if exist_mode == "clean" and _is_nonempty(set_dir):
+        clear_directory(set_dir)
+        print(YELLOW + "Folder cleaned." + RESET)
 
     # Reference + timer
     start_time = time.time()
-    ref_meta = get_set_meta(set_meta["code"])
+    # set_meta already comes from the bulk /sets list; only refetch if it lacks the size fields
+    ref_meta = set_meta
+    if "card_count" not in ref_meta and "printed_size" not in ref_meta:
+        ref_meta = get_set_meta(set_meta["code"])
     expected_prints = ref_meta.get("card_count") or ref_meta.get("printed_size")
 
     total_regs, cards = scry_search_cards_for_set_cached(set_meta["code"])
 
-    name_counts: Dict[str, int] = {}
     downloaded = 0
-    skipped = 0
     errors = 0
 
     log_path = set_dir / f"errors_{set_code}.log"
-    log = []
 
+    # 1) Plan every file name up front, then download
+    jobs, skipped, log = plan_set_downloads(cards, set_dir, exist_mode)
+
+    # 2) Download + save (PIL work included) on a small worker pool
     tqdm_desc = f"[{set_code}] downloading"
+    # redraw at most ~200 times per set (and every 0.1s at most): cached/fast runs were bound by stderr writes
+    postfix_every = max(1, len(jobs) // 200)
     pbar = tqdm(
-        cards,
+        total=len(jobs),
         desc=tqdm_desc,
-        unit="card",
+        unit="img",
         dynamic_ncols=True,
+        miniters=postfix_every,
+        mininterval=0.1,
         bar_format="{l_bar}{bar} {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] | {postfix}"
     )
-    for card in pbar:
-
-        # Short cards name beside download bar
-        label = (card.get("name") or "").replace("\n", " ").strip()
-        if label:
-            colored = f"{PINK}{label[:40]}{RESET}"
-            pbar.set_postfix_str(colored)
-            
-        entries = pick_image_entries(card)
-        if not entries:
-            skipped += 1
-            log.append(f"[NO_IMAGE] {card.get('name','Unknown')} ({card.get('id')})")
-            continue
+    with ThreadPoolExecutor(max_workers=DL_WORKERS) as pool:
+        for fut, (entry, card, _out) in _iter_downloads(pool, jobs, DL_QUEUE):
+            pbar.update(1)
 
-        for entry in entries:
-            base_name = slugify_filename(entry.name)
-            ext = infer_ext_from_url(entry.url)
-
-            count_key = base_name
-            cnt = name_counts.get(count_key, 0) + 1
-            name_counts[count_key] = cnt
-            suffix = "" if cnt == 1 else str(cnt)
-            final_name = f"{base_name}{suffix}.fullborder{ext}"
-
-            out_path = set_dir / final_name
-
-            if out_path.exists():
-                if exist_mode == "overwrite":
-                    pass
-                else:
-                    skipped += 1
-                    continue
+            # Short cards name beside download bar (refresh=False: the bar redraws on its own schedule)
+            if pbar.n % postfix_every == 0:
+                label = (card.get("name") or "").replace("\n", " ").strip()
+                if label:
+                    pbar.set_postfix_str(f"{PINK}{label[:40]}{RESET}", refresh=False)
 
             try:
-                content = download_bytes_with_retry(entry.url)
-
-                save_image(
-                    content,
-                    out_path,
-                    card=card,
-                    rotate_mode=entry.rotate
-                )
+                fut.result()
                 downloaded += 1
 
             except requests.exceptions.HTTPError as ex:
                 errors += 1
                 status = ex.response.status_code if ex.response is not None else "?"
-                log.append(f"[HTTP {status}] {entry.name} -> {entry.url} :: {ex}")
+                log += f"[HTTP {status}] {entry.name} -> {entry.url} :: {ex}\n".encode("utf-8")
 
             except Exception as ex:
                 errors += 1
-                log.append(f"[EXCEPTION] {entry.name} -> {entry.url} :: {ex}")
+                log += f"[EXCEPTION] {entry.name} -> {entry.url} :: {ex}\n".encode("utf-8")
 
     pbar.close()
 
     # --- Reserved set folder promotion (_CON -> CON) ---
-    promoted, promo_msg = promote_reserved_set_folder(base_dir, set_code)
+    if is_windows_reserved_set_code(set_code):
+        promoted, promo_msg = promote_reserved_set_folder(base_dir, set_code)
+    else:
+        promoted, promo_msg = False, "—"
 
     # If promoted, update set_dir so the summary shows the final folder
     if promoted:
@@ -1525,8 +2084,7 @@ def download_set(set_meta: dict, base_dir: Path, exist_mode: str = "skip") -> No
     avg_speed = downloaded / elapsed if elapsed > 0 else 0.0
 
     if log:
-        with open(log_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(log))
+        log_path.write_bytes(bytes(log))
 
     lines = [
         f"{BRIGHT}SET{RESET} {set_code} {BRIGHT}completed{RESET}.",
@@ -1539,405 +2097,315 @@ def download_set(set_meta: dict, base_dir: Path, exist_mode: str = "skip") -> No
         f"Average speed: {CYAN}{avg_speed:.2f} images/s{RESET}",
         (f"Error log: {log_path}" if log else "No errors recorded."),
         f"Folder: {set_dir}",
-        (f"Reserved-name handling: {promo_msg}" if is_windows_reserved_set_code(set_code) else "Reserved-name handling: —"),
+        f"Reserved-name handling: {promo_msg}",
     ]
     box(lines, color=GREEN)
 
-# ---------- Main flow ----------
+# ---------- Main menu actions ----------
 
-def main():
-    banner()
-    sets_meta = get_all_sets()
-    base_dir = prompt_base_dir()
+def _offer_specific_set_mode(base_dir: Path, sets_meta: List[dict]) -> None:
+    """Post-batch: offer the specific-set loop (same experience as the other options)."""
+    again = input("Switch to specific-set mode now? (y/N): ").strip().lower()
+    if again not in {"y", "yes"}:
+        return
+    while True:
+        set_meta = prompt_set_code(sets_meta)
+        set_dir = base_dir / safe_set_folder_name((set_meta.get("code") or "UNK"))
+        ensure_dir(set_dir)
+        exist_mode2 = "skip"
+        if _is_nonempty(set_dir):
+            exist_mode2 = prompt_existing_set_dir_action(set_dir)
+        download_set(set_meta, base_dir, exist_mode=exist_mode2, set_dir=set_dir)
+
+        again2 = input("Download another set? (y/N): ").strip().lower()
+        if again2 not in {"y", "yes"}:
+            break
 
+def specific_set_action(base_dir: Path, sets_meta: List[dict]) -> None:
+    """1) Specific SET (with Back and folder handling)."""
     while True:
-        choice = prompt_main_menu()
-        if choice == "0":
-            box([
-                f"{BRIGHT}Scryfall Scrapper — Session Ended{RESET}",
-                "",
-                f"{CYAN}May your pulls be mythic and your downloads flawless.{RESET}",
-                "",
-                f"{PINK}@Laryzinha{RESET}"
-            ], color=PINK)
+        chosen = prompt_specific_set(sets_meta)
+        if chosen is None:
+            # User press [B] go back to main menu
             break
 
-        if choice == "1":
-            # Specific set (Return and COnfirm)
-            while True:
-                chosen = prompt_specific_set(sets_meta)
-                if chosen is None:
-                    # User press [B] go back to main menu
-                    break
+        set_code = (chosen.get("code") or "").upper()
+        set_dir = base_dir / safe_set_folder_name(set_code)
+        ensure_dir(set_dir)
 
-                set_code = (chosen.get("code") or "").upper()
-                set_dir = base_dir / safe_set_folder_name(set_code)
-                ensure_dir(set_dir)
+        exist_mode = "skip"
+        if _is_nonempty(set_dir):
+            exist_mode = prompt_existing_set_dir_action(set_dir)
 
-                exist_mode = "skip"
-                if any(set_dir.iterdir()):
-                    exist_mode = prompt_existing_set_dir_action(set_dir)
+        # IF back with none, back to menu without download
+        if exist_mode is None:
+            break
 
-                # IF back with none, back to menu without download
-                if exist_mode is None:
-                    break
+        download_set(chosen, base_dir, exist_mode=exist_mode, set_dir=set_dir)
 
-                download_set(chosen, base_dir, exist_mode=exist_mode)
+        again = input("Download another set? (y/N): ").strip().lower()
+        if again not in {"y", "yes"}:
+            break
 
-                again = input("Download another set? (y/N): ").strip().lower()
-                if again not in {"y", "yes"}:
-                    break
-            continue
+def all_sets_action(base_dir: Path, sets_meta: List[dict]) -> None:
+    """2) ALL SETs (scope selection, preview, confirmation, folder policy)."""
+    # Mini-menu de escopo
+    scope = _prompt_scope(_SCOPE_BOX)
+    if scope is None:
+        return  # volta ao menu principal
 
-        elif choice == "2":
-            # === ALL SETs (scope selection, preview, confirmation, folder policy) ===
+    scope_label = _SCOPE_LABELS[scope]
 
-            # Mini-menu de escopo
-            box([
-                f"{BRIGHT}Select ALL-SETs scope{RESET}",
-                "",
-                f"{CYAN}1){RESET} Absolutely ALL sets (includes tokens, minigames, memorabilia, etc.)",
-                f"{CYAN}2){RESET} All except tokens",
-                f"{CYAN}3){RESET} Curated (recommended) — playable/normal sets only",
-                f"{CYAN}4){RESET} Back to main menu"
-            ], color=CYAN)
+    # Seleção + ordenação por data
+    all_sets = sorted_sets_by_release(sets_meta, scope)
 
-            while True:
-                scope = input(BRIGHT + "Your choice [1-4]: " + RESET).strip()
-                if scope in {"1", "2", "3", "4"}:
-                    break
-                print(RED + "Invalid option, try again." + RESET)
-
-            if scope == "4":
-                continue  # volta ao menu principal
-
-            # Tipos oficiais da Scryfall
-            # (mantemos aqui por clareza; não filtramos por 'all_types' diretamente)
-            curated_types = {
-                "core", "expansion", "masters", "eternal", "draft_innovation",
-                "funny", "starter", "commander", "planechase",
-                "archenemy", "duel_deck", "arsenal", "spellbook",
-                "from_the_vault", "premium_deck", "masterpiece", "promo"
-            }
-
-            if scope == "1":
-                filt = lambda s: True  # absolutamente tudo
-                scope_label = "ALL (everything)"
-            elif scope == "2":
-                filt = lambda s: (s.get("set_type") != "token")
-                scope_label = "All except tokens"
-            else:  # scope == "3"
-                filt = lambda s: (s.get("set_type") in curated_types)
-                scope_label = "Curated (recommended)"
-
-            # Seleção + ordenação por data
-            all_sets = [s for s in sets_meta if filt(s)]
-            all_sets.sort(key=lambda x: x.get("released_at") or "1900-01-01")
-
-            # Preview antes de baixar
-            preview_lines = [f"{BRIGHT}ALL SETs — batch run{RESET}", ""]
-            preview_lines.append(f"Selected scope: {CYAN}{scope_label}{RESET}")
-            preview_lines.append(f"Total sets selected: {CYAN}{len(all_sets)}{RESET}")
-            preview_lines.append("")
-            preview_lines.append("Heads up: this may take a long time.")
-            box(preview_lines, color=YELLOW)
-
-            # Confirmação para começar
-            if not prompt_yes_no("Start batch download now", default_no=True):
-                continue
+    # Preview antes de baixar
+    preview_lines = [f"{BRIGHT}ALL SETs — batch run{RESET}", ""]
+    preview_lines.append(f"Selected scope: {CYAN}{scope_label}{RESET}")
+    preview_lines.append(f"Total sets selected: {CYAN}{len(all_sets)}{RESET}")
+    preview_lines.append("")
+    preview_lines.append("Heads up: this may take a long time.")
+    box(preview_lines, color=YELLOW)
 
-            # Política para pastas existentes
-            box([
-                f"{BRIGHT}Folder handling for this batch{RESET}",
-                "",
-                "For every SET in this ALL batch:",
-                f"  {GREEN}1){RESET} Keep existing files and skip duplicates (fastest)",
-                f"  {YELLOW}2){RESET} Overwrite existing files",
-                f"  {RED}3){RESET} Clean the folder completely and redownload",
-                f"  {CYAN}4){RESET} Back to Main Menu"
-            ], color=CYAN)
+    # Confirmação para começar
+    if not prompt_yes_no("Start batch download now", default_no=True):
+        return
 
-            back_to_menu = False
-            exist_mode = None
+    # Política para pastas existentes
+    exist_mode = _prompt_folder_policy(allow_overwrite=True)
+    if exist_mode is None:
+        return
 
-            while True:
-                c = input(BRIGHT + "Choose an option [1-4]: " + RESET).strip()
-                if c == "1":
-                    exist_mode = "skip"; break
-                elif c == "2":
-                    exist_mode = "overwrite"; break
-                elif c == "3":
-                    confirm = input(
-                        BRIGHT + YELLOW +
-                        "This will DELETE all files in each set folder before downloading. Proceed? [y/N]: " +
-                        RESET
-                    ).strip().lower()
-                    if confirm in {"y", "yes"}:
-                        exist_mode = "clean"; break
-                    else:
-                        print(YELLOW + "Cancelled clean. Please choose another option." + RESET)
-                        continue
-                elif c == "4":
-                    back_to_menu = True; break
-                else:
-                    print(RED + "Invalid option. Please enter 1, 2, 3 or 4." + RESET)
+    # Big batches: one bulk file instead of paging /cards/search for every set
+    if len(all_sets) >= BULK_MIN_SETS:
+        prepare_bulk_index()
 
-            if back_to_menu:
-                continue
+    # Loop dos sets — NÃO deixa o batch morrer + pausa entre sets
+    errlog = None  # batch_errors.log, opened on the first failure and kept open for the batch
+    try:
+        for sm in all_sets:
+            code = (sm.get("code") or "").upper()
+            set_name = sm.get("name", "Unknown")
 
-            # Loop dos sets — NÃO deixa o batch morrer + pausa entre sets
-            for sm in all_sets:
-                code = (sm.get("code") or "").upper()
-                set_name = sm.get("name", "Unknown")
+            # IMPORTANT: use Windows-safe folder name (CON, PRN, AUX, etc.)
+            set_dir = base_dir / safe_set_folder_name(code)
+            ensure_dir(set_dir)
 
-                # IMPORTANT: use Windows-safe folder name (CON, PRN, AUX, etc.)
-                safe_code = safe_set_folder_name(code)
-                set_dir = base_dir / safe_code
-                ensure_dir(set_dir)
+            print(f"\n>>> {set_name} [{code}] <<<")
 
-                print(f"\n>>> {set_name} [{code}] <<<")
+            try:
+                download_set(sm, base_dir, exist_mode=exist_mode, set_dir=set_dir)
+            except Exception as e:
+                # não mata o batch por causa de 1 set (rede, 429, reset, etc.)
+                box([
+                    f"{BRIGHT}{YELLOW}SET skipped due to network/error{RESET}",
+                    f"Set: {code} — {set_name}",
+                    f"Error: {e}"
+                ], color=YELLOW)
 
+                # log simples (opcional)
                 try:
-                    download_set(sm, base_dir, exist_mode=exist_mode)
-                except Exception as e:
-                    # não mata o batch por causa de 1 set (rede, 429, reset, etc.)
-                    box([
-                        f"{BRIGHT}{YELLOW}SET skipped due to network/error{RESET}",
-                        f"Set: {code} — {set_name}",
-                        f"Error: {e}"
-                    ], color=YELLOW)
-
-                    # log simples (opcional)
-                    try:
-                        with open(base_dir / "batch_errors.log", "a", encoding="utf-8") as f:
-                            f.write(f"{code} :: {set_name} :: {repr(e)}\n")
-                    except Exception:
-                        pass
-
-                # pausa curtinha entre sets (reduz WinError 10054 em execução longa)
-                time.sleep(SET_PAUSE)
-
-
-            # Pós-batch: oferecer ir ao modo específico (mesma experiência das outras opções)
-            again = input("Switch to specific-set mode now? (y/N): ").strip().lower()
-            if again in {"y", "yes"}:
-                while True:
-                    set_meta = prompt_set_code(sets_meta)
-                    set_dir = base_dir / safe_set_folder_name((set_meta.get("code") or "UNK"))
-                    ensure_dir(set_dir)
-                    exist_mode2 = "skip"
-                    if any(set_dir.iterdir()):
-                        exist_mode2 = prompt_existing_set_dir_action(set_dir)
-                    download_set(set_meta, base_dir, exist_mode=exist_mode2)
+                    if errlog is None:
+                        errlog = open(base_dir / "batch_errors.log", "a", encoding="utf-8")
+                    errlog.write(f"{code} :: {set_name} :: {repr(e)}\n")
+                except Exception:
+                    pass
 
-                    again2 = input("Download another set? (y/N): ").strip().lower()
-                    if again2 not in {"y", "yes"}:
-                        break
+            # pausa curtinha entre sets (reduz WinError 10054 em execução longa)
+            time.sleep(SET_PAUSE)
+    finally:
+        if errlog is not None:
+            errlog.close()
+        finish_bulk_batch()
 
+    _offer_specific_set_mode(base_dir, sets_meta)
 
-        elif choice == "3":
-            # === Batch via Sets.txt (UX melhorada) ===
-            default_path = (Path(__file__).resolve().parent / "Sets.txt") if '__file__' in globals() else (Path.cwd() / "Sets.txt")
+def sets_txt_action(base_dir: Path, sets_meta: List[dict]) -> None:
+    """3) Batch via Sets.txt."""
+    default_path = SETS_TXT_DEFAULT
+
+    box([
+        "Path to Sets.txt (PRESS ENTER for default):",
+        f"{default_path}"
+    ], color=PINK)
+    p = input(BRIGHT + "Enter path to Sets.txt (or press ENTER for default): " + RESET).strip()
+    file_path = Path(p) if p else default_path
 
+    # 1) Se NÃO existir, cria com um template amigável e orienta o usuário
+    if not file_path.exists():
+        try:
+            template = "\n".join([
+                "# One set per line. You can use set code or part of the name.",
+                "# Lines starting with # are ignored.",
+                "# Examples:",
+                "# 40K",
+                "# Ninth Edition",
+                "# Arena Anthology 2",
+                "# aAa1   (codes and names are fuzzy-matched)",
+                "",
+            ])
+            file_path.write_text(template, encoding="utf-8")
             box([
-                "Path to Sets.txt (PRESS ENTER for default):",
-                f"{default_path}"
-            ], color=PINK)
-            p = input(BRIGHT + "Enter path to Sets.txt (or press ENTER for default): " + RESET).strip()
-            file_path = Path(p) if p else default_path
+                f"'{file_path.name}' was not found, so a template was created here:",
+                f"{file_path}",
+                "",
+                "Add your sets (one per line) and run this option again."
+            ], color=YELLOW)
+        except Exception as ex:
+            box([
+                "Could not create the file:",
+                f"{file_path}",
+                f"Error: {ex}"
+            ], color=RED)
+        input("\nPress ENTER to return to the main menu...")
+        return
 
-            # 1) Se NÃO existir, cria com um template amigável e orienta o usuário
-            if not file_path.exists():
-                try:
-                    template = "\n".join([
-                        "# One set per line. You can use set code or part of the name.",
-                        "# Lines starting with # are ignored.",
-                        "# Examples:",
-                        "# 40K",
-                        "# Ninth Edition",
-                        "# Arena Anthology 2",
-                        "# aAa1   (codes and names are fuzzy-matched)",
-                        "",
-                    ])
-                    file_path.write_text(template, encoding="utf-8")
-                    box([
-                        f"'{file_path.name}' was not found, so a template was created here:",
-                        f"{file_path}",
-                        "",
-                        "Add your sets (one per line) and run this option again."
-                    ], color=YELLOW)
-                except Exception as ex:
-                    box([
-                        "Could not create the file:",
-                        f"{file_path}",
-                        f"Error: {ex}"
-                    ], color=RED)
-                input("\nPress ENTER to return to the main menu...")
-                continue
+    # 2) Arquivo existe: ler conteúdo cru para decidir o fluxo
+    raw_lines = file_path.read_text(encoding="utf-8").splitlines()
+    # Conteúdo útil (sem linhas vazias/comentários)
+    effective_lines = sets_file_lines(raw_lines)
 
-            # 2) Arquivo existe: ler conteúdo cru para decidir o fluxo
-            raw_lines = file_path.read_text(encoding="utf-8").splitlines()
-            # Conteúdo útil (sem linhas vazias/comentários)
-            effective_lines = [ln.strip() for ln in raw_lines if ln.strip() and not ln.strip().startswith("#")]
+    # 2.a) Se vazio: orientar e voltar
+    if not effective_lines:
+        box([
+            "Sets.txt is empty or only has comments.",
+            "",
+            "How to fill it:",
+            f" - One set per line (code or name), e.g.:",
+            f"   40K",
+            f"   Ninth Edition",
+            f"   Arena Anthology 2",
+            "",
+            f"File: {file_path}"
+        ], color=YELLOW)
+        input("\nAdd some sets and press ENTER to return to the main menu...")
+        return
 
-            # 2.a) Se vazio: orientar e voltar
-            if not effective_lines:
-                box([
-                    "Sets.txt is empty or only has comments.",
-                    "",
-                    "How to fill it:",
-                    f" - One set per line (code or name), e.g.:",
-                    f"   40K",
-                    f"   Ninth Edition",
-                    f"   Arena Anthology 2",
-                    "",
-                    f"File: {file_path}"
-                ], color=YELLOW)
-                input("\nAdd some sets and press ENTER to return to the main menu...")
-                continue
+    # 3) Perguntar se deseja seguir com a listagem encontrada
+    preview = [f"{BRIGHT}We found {len(effective_lines)} line(s) in Sets.txt{RESET}", ""]
+    # Mostra até 10 exemplos para não poluir
+    for i, ln in enumerate(effective_lines[:10], start=1):
+        preview.append(f"{i:>2}) {ln}")
+    if len(effective_lines) > 10:
+        preview.append(f"... (+{len(effective_lines)-10} more)")
 
-            # 3) Perguntar se deseja seguir com a listagem encontrada
-            preview = [f"{BRIGHT}We found {len(effective_lines)} line(s) in Sets.txt{RESET}", ""]
-            # Mostra até 10 exemplos para não poluir
-            for i, ln in enumerate(effective_lines[:10], start=1):
-                preview.append(f"{i:>2}) {ln}")
-            if len(effective_lines) > 10:
-                preview.append(f"... (+{len(effective_lines)-10} more)")
+    preview.append("")
+    preview.append("Proceed using this file?")
+    box(preview, color=CYAN)
 
-            preview.append("")
-            preview.append("Proceed using this file?")
-            box(preview, color=CYAN)
+    if not prompt_yes_no("Proceed", default_no=True):
+        input("\nNo problem. Press ENTER to return to the main menu...")
+        return
 
-            if not prompt_yes_no("Proceed", default_no=True):
-                input("\nNo problem. Press ENTER to return to the main menu...")
-                continue
+    # 4) Resolver sets (fuzzy) e validar
+    found, missing = resolve_sets(sets_meta, effective_lines)
 
-            # 4) Resolver sets (fuzzy) e validar
-            found, missing = load_sets_from_file(sets_meta, file_path)
+    if not found and missing:
+        box(["No sets resolved. Check these lines:"] + [f"- {m}" for m in missing], color=RED)
+        input("\nFix the file and press ENTER to return to the main menu...")
+        return
+    elif not found:
+        box(["Sets.txt is empty or invalid."], color=RED)
+        input("\nFix the file and press ENTER to return to the main menu...")
+        return
 
-            if not found and missing:
-                box(["No sets resolved. Check these lines:"] + [f"- {m}" for m in missing], color=RED)
-                input("\nFix the file and press ENTER to return to the main menu...")
-                continue
-            elif not found:
-                box(["Sets.txt is empty or invalid."], color=RED)
-                input("\nFix the file and press ENTER to return to the main menu...")
-                continue
+    # 5) Preview de sets resolvidos + os não resolvidos
+    box([f"Resolved sets ({len(found)}):"] + [f"- {m['name']} [{(m.get('code') or '').upper()}]" for m in found], color=CYAN)
+    if missing:
+        box(["Not resolved (check spelling or use codes):"] + [f"- {m}" for m in missing], color=YELLOW)
+    print("")
 
-            # 5) Preview de sets resolvidos + os não resolvidos
-            box([f"Resolved sets ({len(found)}):"] + [f"- {m['name']} [{(m.get('code') or '').upper()}]" for m in found], color=CYAN)
-            if missing:
-                box(["Not resolved (check spelling or use codes):"] + [f"- {m}" for m in missing], color=YELLOW)
-            print("")
+    # 6) Política de pasta (com Back)
+    exist_mode = _prompt_folder_policy(
+        allow_overwrite=True,
+        lines=_SETS_TXT_FOLDER_POLICY_BOX,
+        clean_warning="This will DELETE all files in each set folder.",
+    )
+    if exist_mode is None:
+        return
 
-            # 6) Política de pasta (com Back)
-            box([
-                f"{BRIGHT}Folder handling for this batch{RESET}",
-                "",
-                "For each SET listed above:",
-                f"  {GREEN}1){RESET} Keep existing files and skip duplicates (fastest)",
-                f"  {YELLOW}2){RESET} Overwrite existing files",
-                f"  {RED}3){RESET} Clean the folder completely and redownload",
-                f"  {CYAN}4){RESET} Back to Main Menu"
-            ], color=CYAN)
+    # 7) Executa o batch
+    for sm in found:
+        set_code = (sm.get("code") or "").upper()
+        set_dir = base_dir / safe_set_folder_name(set_code)
+        ensure_dir(set_dir)
 
-            back_to_menu = False
-            exist_mode = None
+        print(f"\n>>> {sm.get('name','Unknown')} [{set_code}] <<<")
+        download_set(sm, base_dir, exist_mode=exist_mode, set_dir=set_dir)
 
-            while True:
-                mode = input(BRIGHT + "Choose an option [1-4]: " + RESET).strip()
-                if mode == "1":
-                    exist_mode = "skip"; break
-                elif mode == "2":
-                    exist_mode = "overwrite"; break
-                elif mode == "3":
-                    confirm = input(BRIGHT + YELLOW + "This will DELETE all files in each set folder. Proceed? [y/N]: " + RESET).strip().lower()
-                    if confirm in {"y", "yes"}:
-                        exist_mode = "clean"; break
-                    else:
-                        print(YELLOW + "Cancelled clean. Please choose another option." + RESET)
-                        continue
-                elif mode == "4":
-                    back_to_menu = True; break
-                else:
-                    print(RED + "Invalid option. Please enter 1, 2, 3 or 4." + RESET)
+    _offer_specific_set_mode(base_dir, sets_meta)
 
-            if back_to_menu:
-                continue
+def audit_cards_action(base_dir: Path, sets_meta: List[dict]) -> None:
+    """6) Forge Audit — cards by name/prints."""
+    if ad is None:
+        box(["AuditDownloader.py not found next to this script."], color=RED)
+    else:
+        box([
+            f"{BRIGHT}Forge Audit — CARDS by name/prints{RESET}",
+            "",
+            "This flow reads your Forge Audit and downloads CARD IMAGES by NAME",
+            "(oracle/printed/flavor), choosing specific prints when you suffix",
+            "with numbers (e.g., '...2', '...3').",
+            "",
+            f"{YELLOW}Note:{RESET} This is NOT for tokens. For TOKENS use menu option 4.",
+        ], color=PINK)
+        ad.audit_download_flow()
+    input("\nDone. Press ENTER to return to the main menu...")
 
-            # 7) Executa o batch
-            for sm in found:
-                set_code = (sm.get("code") or "").upper()
-                set_dir = base_dir / safe_set_folder_name(set_code)
-                ensure_dir(set_dir)
+def printed_name_action(base_dir: Path, sets_meta: List[dict]) -> None:
+    """7) Printed-Name SET downloader (experimental), after a confirmation."""
+    box([
+        f"{BRIGHT}Printed-Name SET Downloader — Experimental{RESET}",
+        "",
+        "This mode prioritizes printed / flavor names for filenames.",
+        "Recommended for Secret Lair and special prints",
+        "(e.g., 'Unlicensed Hearse' printed as 'Ecto-1').",
+        "",
+        f"{YELLOW}Heads up:{RESET} Filenames may differ from the standard SET downloader.",
+        "Use this only when the normal SET download does not match printed names.",
+    ], color=YELLOW)
 
-                print(f"\n>>> {sm.get('name','Unknown')} [{set_code}] <<<")
-                download_set(sm, base_dir, exist_mode=exist_mode)
+    proceed = input(BRIGHT + "Open this mode now? [y/N]: " + RESET).strip().lower()
+    if proceed not in {"y", "yes"}:
+        return
 
-            # 8) Oferece ir para modo específico ao final (mesma experiência do seu fluxo)
-            again = input("Switch to specific-set mode now? (y/N): ").strip().lower()
-            if again in {"y", "yes"}:
-                while True:
-                    set_meta = prompt_set_code(sets_meta)
-                    set_dir = base_dir / safe_set_folder_name((set_meta.get("code") or "UNK"))
-                    ensure_dir(set_dir)
-                    exist_mode2 = "skip"
-                    if any(set_dir.iterdir()):
-                        exist_mode2 = prompt_existing_set_dir_action(set_dir)
-                    download_set(set_meta, base_dir, exist_mode=exist_mode2)
-
-                    again2 = input("Download another set? (y/N): ").strip().lower()
-                    if again2 not in {"y", "yes"}:
-                        break
-
-        elif choice == "4":
-            tokens_menu(base_dir)
-
-        elif choice == "5":
-            singles_menu(base_dir)
-
-        elif choice == "6":
-            if ad is None:
-                box(["AuditDownloader.py not found next to this script."], color=RED)
-            else:
-                box([
-                    f"{BRIGHT}Forge Audit — CARDS by name/prints{RESET}",
-                    "",
-                    "This flow reads your Forge Audit and downloads CARD IMAGES by NAME",
-                    "(oracle/printed/flavor), choosing specific prints when you suffix",
-                    "with numbers (e.g., '...2', '...3').",
-                    "",
-                    f"{YELLOW}Note:{RESET} This is NOT for tokens. For TOKENS use menu option 4.",
-                ], color=PINK)
-                ad.audit_download_flow()
-            input("\nDone. Press ENTER to return to the main menu...")
-
-        elif choice == "7":
+    printed_name_set_menu(base_dir)
+
+# Menu choice -> action(base_dir, sets_meta). "0" (exit) is handled by main().
+ACTIONS = {
+    "1": specific_set_action,
+    "2": all_sets_action,
+    "3": sets_txt_action,
+    "4": lambda base_dir, sets_meta: tokens_menu(base_dir),
+    "5": lambda base_dir, sets_meta: singles_menu(base_dir),
+    "6": audit_cards_action,
+    "7": printed_name_action,
+    "8": lambda base_dir, sets_meta: fastcsv_set_menu(base_dir),
+    "9": lambda base_dir, sets_meta: fastcsv_all_sets_menu(base_dir),
+}
+
+# ---------- Main flow ----------
+
+def main():
+    banner()
+    sets_meta = get_all_sets()
+    base_dir = prompt_base_dir()
+
+    while True:
+        choice = prompt_main_menu()
+        if choice == "0":
             box([
-                f"{BRIGHT}Printed-Name SET Downloader — Experimental{RESET}",
+                f"{BRIGHT}Scryfall Scrapper — Session Ended{RESET}",
                 "",
-                "This mode prioritizes printed / flavor names for filenames.",
-                "Recommended for Secret Lair and special prints",
-                "(e.g., 'Unlicensed Hearse' printed as 'Ecto-1').",
+                f"{CYAN}May your pulls be mythic and your downloads flawless.{RESET}",
                 "",
-                f"{YELLOW}Heads up:{RESET} Filenames may differ from the standard SET downloader.",
-                "Use this only when the normal SET download does not match printed names.",
-            ], color=YELLOW)
-
-            proceed = input(BRIGHT + "Open this mode now? [y/N]: " + RESET).strip().lower()
-            if proceed not in {"y", "yes"}:
-                continue
-
-            printed_name_set_menu(base_dir)
-            continue
-        
-        elif choice == "9":
-            fastcsv_all_sets_menu(base_dir)
-            continue
+                f"{PINK}@Laryzinha{RESET}"
+            ], color=PINK)
+            break
 
-        elif choice == "8":
-            fastcsv_set_menu(base_dir)
-            continue
+        action = ACTIONS.get(choice)
+        if action is not None:
+            action(base_dir, sets_meta)
 
 
 if __name__ == "__main__":
@@ -11,14 +11,24 @@ import os
 import re
 import time
 import difflib
+import functools
+import json
 import unicodedata
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, NamedTuple
+from typing import Dict, Iterator, List, Optional, NamedTuple
 
 import requests
 from tqdm import tqdm
 
+# Optional: RapidFuzz (C++) for close matches; falls back to difflib when missing
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+except Exception:
+    rf_fuzz = rf_process = None
+
 # ------------------------------------------------------------
 # Colors / UI helpers
 # ------------------------------------------------------------
@@ -39,14 +49,22 @@ _ansi_re = re.compile(r"\x1b\[[0-9;]*m")
 
 
 def _visible_len(s: str) -> int:
-    return len(_ansi_re.sub("", s))
+    # Plain lines (no escape codes) skip the regex entirely
+    if "\x1b" not in s:
+        return len(s)
+    hidden = 0
+    for m in _ansi_re.finditer(s):
+        hidden += m.end() - m.start()
+    return len(s) - hidden
 
 
 def box(lines: List[str], color=YELLOW):
-    width = max(_visible_len(l) for l in lines) if lines else 0
+    # Measure each line once (used for both width and padding)
+    widths = [_visible_len(l) for l in lines]
+    width = max(widths, default=0)
     print(color + "╔" + "═" * (width + 2) + "╗" + RESET)
-    for l in lines:
-        pad = width - _visible_len(l)
+    for l, w in zip(lines, widths):
+        pad = width - w
         print(color + "║ " + RESET + l + " " * pad + color + " ║" + RESET)
     print(color + "╚" + "═" * (width + 2) + "╝" + RESET)
 
@@ -64,28 +82,68 @@ def format_duration(seconds: float) -> str:
 # ------------------------------------------------------------
 SCRYFALL_API = "https://api.scryfall.com"
 
-RATE_SLEEP = 0.20
+RATE_SLEEP = 0.20     # Image pacing: DL_WORKERS fetches per RATE_SLEEP
+API_INTERVAL = 0.10   # Min spacing between api.scryfall.com calls (~10 req/s)
 TIMEOUT = 30
 RETRY = 6
 BACKOFF_BASE = 1.2
 BACKOFF_JITTER = 0.35
+DL_WORKERS = 8  # Parallel image downloads per SET
+STREAM_CHUNK = 64 * 1024  # Chunk size when streaming images straight to disk
 
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": "ForgeImageFetcher/1.1 (laryzinha)"})
+# Pool sized for the download workers (default pool keeps only 10 connections per host)
+_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+
+class TokenBucket:
+    """
+    Shared rate limiter: `rate` tokens/s, up to `capacity` banked.
+    acquire() reserves a token under the lock and sleeps outside it.
+    """
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait_s = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_s > 0:
+            time.sleep(wait_s)
+
+
+# API calls are spaced API_INTERVAL apart across all threads (Scryfall asks for
+# 50-100 ms); image fetches go to the CDN and share a bucket sized for the pool.
+API_LIMITER = TokenBucket(rate=1 / API_INTERVAL, capacity=1)
+IMG_LIMITER = TokenBucket(rate=DL_WORKERS / RATE_SLEEP, capacity=DL_WORKERS)
 
 
 def scry_get_json(url: str, *, params=None) -> dict:
+    return scry_get(url, params=params).json()
+
+
+def scry_get(url: str, *, params=None, headers=None) -> requests.Response:
     last_exc = None
     for attempt in range(1, RETRY + 1):
         try:
-            r = SESSION.get(url, params=params, timeout=TIMEOUT)
+            API_LIMITER.acquire()
+            r = SESSION.get(url, params=params, headers=headers, timeout=TIMEOUT)
 
             if r.status_code == 429 or 500 <= r.status_code <= 599:
                 raise requests.exceptions.HTTPError(f"HTTP {r.status_code}", response=r)
 
             r.raise_for_status()
-            time.sleep(RATE_SLEEP)
-            return r.json()
+            return r
 
         except (
             requests.exceptions.Timeout,
@@ -99,25 +157,41 @@ def scry_get_json(url: str, *, params=None) -> dict:
     raise last_exc
 
 
-def download_bytes_with_retry(url: str) -> bytes:
+def download_to_path(url: str, path: Path) -> None:
+    """
+    Streams the image to disk in 64 KiB chunks (via a .part file) instead of
+    holding the whole PNG in memory. The .part file is dropped on failure.
+    """
     last_exc = None
+    part = path.with_name(path.name + ".part")
     for attempt in range(1, RETRY + 1):
         try:
-            r = SESSION.get(url, timeout=TIMEOUT)
-            if r.status_code == 429 or 500 <= r.status_code <= 599:
-                raise requests.exceptions.HTTPError(f"HTTP {r.status_code}", response=r)
-
-            r.raise_for_status()
-            time.sleep(RATE_SLEEP)
-            return r.content
+            IMG_LIMITER.acquire()
+            with SESSION.get(url, stream=True, timeout=TIMEOUT) as r:
+                if r.status_code == 429 or 500 <= r.status_code <= 599:
+                    raise requests.exceptions.HTTPError(f"HTTP {r.status_code}", response=r)
+
+                r.raise_for_status()
+                # iter_content (not r.raw) so a stall/reset mid-body surfaces as a requests
+                # exception and is retried like a failed GET
+                with open(part, "wb") as f:
+                    f.writelines(r.iter_content(STREAM_CHUNK))
+            os.replace(part, path)
+            return
 
         except (
             requests.exceptions.Timeout,
             requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ContentDecodingError,
             requests.exceptions.HTTPError,
             OSError,
         ) as e:
             last_exc = e
+            try:
+                part.unlink()
+            except OSError:
+                pass
             if attempt == RETRY:
                 raise
             time.sleep((BACKOFF_BASE ** attempt) + (random.random() * BACKOFF_JITTER))
@@ -127,13 +201,21 @@ def download_bytes_with_retry(url: str) -> bytes:
 # ------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------
+@functools.lru_cache(maxsize=4096)
 def strip_accents(s: str) -> str:
+    # Most set codes/names are plain ASCII: nothing to decompose or strip
+    if s.isascii():
+        return s
     return "".join(c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn")
 
 
+# Windows-invalid filename chars + control chars -> "_" (one C-level pass via str.translate)
+_SLUG_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*' + "".join(map(chr, range(32))), "_"))
+
+
 def slugify(name: str) -> str:
     name = (name or "").strip().replace(":", "-")
-    name = re.sub(r'[<>:"/\\|?*\x00-\x1F]', "_", name)
+    name = name.translate(_SLUG_TABLE)
     name = name.rstrip(" .")
     return name if name else "Unknown"
 
@@ -142,6 +224,12 @@ def cards_root() -> Path:
     return Path(__file__).resolve().parent / "Cards"
 
 
+# /sets cache (ETag / Last-Modified revalidation), same file Downloader.py uses
+SETS_CACHE = Path(__file__).resolve().parent / "cache" / "sets.json"
+# Per-set shards of Scryfall's default_cards bulk file, written by Downloader.py's ALL SETs batches
+BULK_DIR = SETS_CACHE.parent / "bulk"
+
+
 def ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
 
@@ -160,7 +248,116 @@ def clear_directory(p: Path):
 # Scryfall logic
 # ------------------------------------------------------------
 def get_all_sets() -> List[dict]:
-    return scry_get_json(f"{SCRYFALL_API}/sets").get("data", [])
+    # The list is kept on disk with its validators: unchanged => 304 and no body.
+    cached = _read_sets_cache()
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        r = scry_get(f"{SCRYFALL_API}/sets", headers=headers or None)
+    except requests.exceptions.RequestException:
+        if cached:
+            print(f"{YELLOW}[net]{RESET} /sets unreachable — using cached list from {SETS_CACHE.name}")
+            return cached.get("data", [])
+        raise
+
+    if r.status_code == 304 and cached:
+        return cached.get("data", [])
+
+    data = r.json().get("data", [])
+    _write_sets_cache(data, r.headers.get("ETag"), r.headers.get("Last-Modified"))
+    return data
+
+
+def _read_sets_cache() -> Optional[dict]:
+    try:
+        return json.loads(SETS_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_sets_cache(data: List[dict], etag: Optional[str], last_modified: Optional[str]) -> None:
+    if not (etag or last_modified):
+        return  # nothing to revalidate with next time
+    try:
+        SETS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SETS_CACHE.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"etag": etag, "last_modified": last_modified, "data": data}), encoding="utf-8")
+        os.replace(tmp, SETS_CACHE)
+    except OSError:
+        pass  # cache is best-effort
+
+@functools.lru_cache(maxsize=4096)
+def _norm(x: Optional[str]) -> str:
+    return strip_accents((x or "").lower()).strip()
+
+
+class SetNorm(NamedTuple):
+    set: dict
+    code: str
+    name: str
+    arena: str
+    mtgo: str
+
+
+class _SetIndex(NamedTuple):
+    rows: List[SetNorm]        # one row per set, same order as sets_meta
+    names: List[str]           # normalized names (close-match input)
+    codes: List[str]           # normalized codes (close-match input)
+    name_pos: Dict[str, int]   # first position of each name
+    code_pos: Dict[str, int]   # first position of each code
+
+
+# id(sets) -> (sets, index); identity-checked so a new list is re-indexed
+_set_index_cache: Dict[int, tuple] = {}
+
+
+def precompute_norms(sets: List[dict]) -> _SetIndex:
+    """Normalized code/name/arena/mtgo fields, built once per sets list instead of per query."""
+    hit = _set_index_cache.get(id(sets))
+    if hit is not None and hit[0] is sets:
+        return hit[1]
+    rows = [
+        SetNorm(s, _norm(s.get("code")), _norm(s.get("name")), _norm(s.get("arena_code")), _norm(s.get("mtgo_code")))
+        for s in sets
+    ]
+    names = [r.name for r in rows]
+    codes = [r.code for r in rows]
+    name_pos: Dict[str, int] = {}
+    code_pos: Dict[str, int] = {}
+    for i, n in enumerate(names):
+        name_pos.setdefault(n, i)
+    for i, c in enumerate(codes):
+        code_pos.setdefault(c, i)
+    idx = _SetIndex(rows, names, codes, name_pos, code_pos)
+    _set_index_cache[id(sets)] = (sets, idx)
+    return idx
+
+
+def close_match_positions(query: str, choices: List[str], pos: Dict[str, int], n: int) -> List[int]:
+    """
+    Positions (best first) of choices similar to query, score >= 60%.
+    RapidFuzz when installed (indices come back directly), difflib otherwise.
+    """
+    if rf_process is not None:
+        hits = rf_process.extract(query, choices, scorer=rf_fuzz.ratio, limit=n, score_cutoff=60)
+        return [idx for _choice, _score, idx in hits]
+    return [pos[m] for m in difflib.get_close_matches(query, choices, n=n, cutoff=0.60)]
+
+
+def unique_by_code(sets: List[dict]) -> List[dict]:
+    """Drops sets without a code and repeated codes; the first one wins, order preserved."""
+    by_code: Dict[str, dict] = {}
+    for s in sets:
+        code = (s.get("code") or "").upper()
+        if code:
+            by_code.setdefault(code, s)
+    return list(by_code.values())
+
 
 def fuzzy_match_set(user: str, sets: List[dict], top_n: int = 10) -> List[dict]:
     """
@@ -168,87 +365,50 @@ def fuzzy_match_set(user: str, sets: List[dict], top_n: int = 10) -> List[dict]:
       - exact code match
       - arena_code / mtgo_code exact match
       - substring match on name/code
-      - difflib close matches on name/code
+      - close matches on name/code (RapidFuzz or difflib)
     """
     u_raw = (user or "").strip()
     if not u_raw:
         return []
 
     u = strip_accents(u_raw.lower())
-
-    def norm(x: Optional[str]) -> str:
-        return strip_accents((x or "").lower()).strip()
+    fx = precompute_norms(sets)
 
     # 1) Exact code / arena / mtgo
-    exact = []
-    for s in sets:
-        if u == norm(s.get("code")) or u == norm(s.get("arena_code")) or u == norm(s.get("mtgo_code")):
-            exact.append(s)
+    exact = [r.set for r in fx.rows if u == r.code or u == r.arena or u == r.mtgo]
     if exact:
         return exact[:top_n]
 
     # 2) Substring matches (best UX for partial typing)
-    subs = []
-    for s in sets:
-        name_n = norm(s.get("name"))
-        code_n = norm(s.get("code"))
-        arena_n = norm(s.get("arena_code"))
-        mtgo_n = norm(s.get("mtgo_code"))
-        if u in name_n or u in code_n or (arena_n and u in arena_n) or (mtgo_n and u in mtgo_n):
-            subs.append(s)
+    subs_rows = [
+        r for r in fx.rows
+        if u in r.name or u in r.code or (r.arena and u in r.arena) or (r.mtgo and u in r.mtgo)
+    ]
 
     # rank substring results: prefer code startswith, then name contains
-    def subs_score(s: dict) -> tuple:
-        code_n = norm(s.get("code"))
-        name_n = norm(s.get("name"))
-        return (
-            0 if code_n.startswith(u) else 1,
-            0 if u in name_n else 1,
-            len(name_n),
-        )
-
-    subs.sort(key=subs_score)
+    subs_rows.sort(key=lambda r: (
+        0 if r.code.startswith(u) else 1,
+        0 if u in r.name else 1,
+        len(r.name),
+    ))
+    subs = [r.set for r in subs_rows]
 
     # 3) Close matches (fallback)
     if len(subs) < top_n:
-        names = [norm(s.get("name")) for s in sets]
-        codes = [norm(s.get("code")) for s in sets]
-
-        close_names = difflib.get_close_matches(u, names, n=top_n, cutoff=0.60)
-        close_codes = difflib.get_close_matches(u, codes, n=top_n, cutoff=0.60)
-
-        close = []
-        for n in close_names:
-            idx = names.index(n)
-            close.append(sets[idx])
-        for c in close_codes:
-            idx = codes.index(c)
-            close.append(sets[idx])
-
-        # de-dup preserving order
-        seen = set()
-        close_dedup = []
-        for s in close:
-            key = s.get("code")
-            if key and key not in seen:
-                seen.add(key)
-                close_dedup.append(s)
-
-        subs.extend(close_dedup)
+        close = [sets[i] for i in close_match_positions(u, fx.names, fx.name_pos, top_n)]
+        close += [sets[i] for i in close_match_positions(u, fx.codes, fx.code_pos, top_n)]
+        subs.extend(close)
 
     # de-dup and cap
-    seen = set()
-    out = []
-    for s in subs:
-        code = (s.get("code") or "").upper()
-        if not code or code in seen:
-            continue
-        seen.add(code)
-        out.append(s)
-        if len(out) >= top_n:
-            break
+    return unique_by_code(subs)[:top_n]
+
+# Accepted answers for the interactive prompts
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+_NAV_BACK = frozenset({"b", "back"})
+_NAV_NEXT = frozenset({"n", "next"})
+_NAV_PREV = frozenset({"p", "prev", "previous"})
 
-    return out
 
 def pick_set_interactive(sets_meta: List[dict]) -> Optional[dict]:
     """
@@ -258,86 +418,47 @@ def pick_set_interactive(sets_meta: List[dict]) -> Optional[dict]:
       - Input: number / N / P / B
     """
 
-    def norm(x: Optional[str]) -> str:
-        return strip_accents((x or "").lower()).strip()
+    fx = precompute_norms(sets_meta)
 
     def build_matches(query: str) -> List[dict]:
         """
         More like Downloader.py behavior:
         - exact code has priority
         - otherwise return ALL substring matches (not only top 10)
-        - fallback to difflib close matches if no substring results
+        - fallback to close matches (RapidFuzz or difflib) if no substring results
         """
-        q = norm(query)
+        q = _norm(query)
         if not q:
             return []
 
         # 1) exact code / arena / mtgo
-        exact = []
-        for s in sets_meta:
-            if q == norm(s.get("code")) or q == norm(s.get("arena_code")) or q == norm(s.get("mtgo_code")):
-                exact.append(s)
+        exact = [r.set for r in fx.rows if q == r.code or q == r.arena or q == r.mtgo]
         if exact:
             return exact
 
         # 2) substring matches (return all)
-        subs = []
-        for s in sets_meta:
-            name_n = norm(s.get("name"))
-            code_n = norm(s.get("code"))
-            arena_n = norm(s.get("arena_code"))
-            mtgo_n = norm(s.get("mtgo_code"))
-            if q in name_n or q in code_n or (arena_n and q in arena_n) or (mtgo_n and q in mtgo_n):
-                subs.append(s)
+        subs_rows = [
+            r for r in fx.rows
+            if q in r.name or q in r.code or (r.arena and q in r.arena) or (r.mtgo and q in r.mtgo)
+        ]
 
         # rank substring results: prefer code startswith, then name contains, then shorter name
-        def subs_score(s: dict) -> tuple:
-            code_n = norm(s.get("code"))
-            name_n = norm(s.get("name"))
-            return (
-                0 if code_n.startswith(q) else 1,
-                0 if q in name_n else 1,
-                len(name_n),
-            )
-
-        subs.sort(key=subs_score)
+        subs_rows.sort(key=lambda r: (
+            0 if r.code.startswith(q) else 1,
+            0 if q in r.name else 1,
+            len(r.name),
+        ))
+        subs = [r.set for r in subs_rows]
 
         # de-dup by set code
-        seen = set()
-        out = []
-        for s in subs:
-            code = (s.get("code") or "").upper()
-            if not code or code in seen:
-                continue
-            seen.add(code)
-            out.append(s)
-
+        out = unique_by_code(subs)
         if out:
             return out
 
         # 3) fallback: close matches (cap to avoid absurd lists)
-        names = [norm(s.get("name")) for s in sets_meta]
-        codes = [norm(s.get("code")) for s in sets_meta]
-        close_names = difflib.get_close_matches(q, names, n=30, cutoff=0.60)
-        close_codes = difflib.get_close_matches(q, codes, n=30, cutoff=0.60)
-
-        close = []
-        for n in close_names:
-            idx = names.index(n)
-            close.append(sets_meta[idx])
-        for c in close_codes:
-            idx = codes.index(c)
-            close.append(sets_meta[idx])
-
-        seen = set()
-        out = []
-        for s in close:
-            code = (s.get("code") or "").upper()
-            if not code or code in seen:
-                continue
-            seen.add(code)
-            out.append(s)
-        return out
+        close = [sets_meta[i] for i in close_match_positions(q, fx.names, fx.name_pos, 30)]
+        close += [sets_meta[i] for i in close_match_positions(q, fx.codes, fx.code_pos, 30)]
+        return unique_by_code(close)
 
     def fmt_row(i: int, s: dict) -> str:
         code = (s.get("code") or "").upper()
@@ -352,9 +473,9 @@ def pick_set_interactive(sets_meta: List[dict]) -> Optional[dict]:
             ans = input(BRIGHT + f"{question} {suf}: " + RESET).strip().lower()
             if not ans:
                 return not default_no
-            if ans in {"y", "yes"}:
+            if ans in _YES:
                 return True
-            if ans in {"n", "no"}:
+            if ans in _NO:
                 return False
             print(RED + "Invalid option. Please type Y or N." + RESET)
 
@@ -374,7 +495,7 @@ def pick_set_interactive(sets_meta: List[dict]) -> Optional[dict]:
         if not q:
             print(RED + "Please type a set code or name (or 'B' to go back)." + RESET)
             continue
-        if q.lower() in {"b", "back"}:
+        if q.lower() in _NAV_BACK:
             return None
 
         matches = build_matches(q)
@@ -424,13 +545,13 @@ def pick_set_interactive(sets_meta: List[dict]) -> Optional[dict]:
 
             pick = input(BRIGHT + "Choose [# / N / P / B]: " + RESET).strip().lower()
 
-            if pick in {"b", "back"}:
+            if pick in _NAV_BACK:
                 break
-            if pick in {"n", "next"}:
+            if pick in _NAV_NEXT:
                 if page < total_pages - 1:
                     page += 1
                 continue
-            if pick in {"p", "prev", "previous"}:
+            if pick in _NAV_PREV:
                 if page > 0:
                     page -= 1
                 continue
@@ -457,7 +578,60 @@ def pick_set_interactive(sets_meta: List[dict]) -> Optional[dict]:
             print(RED + "Invalid choice." + RESET)
 
 
+_LEADING_DIGITS = re.compile(r"\d+")
+
+
+def _collector_key(card: dict) -> tuple:
+    # numeric part first (2 < 10), then the raw number for suffixes like 12a / 12★
+    cn = card.get("collector_number") or ""
+    m = _LEADING_DIGITS.match(cn)
+    return (0, int(m.group()), cn) if m else (1, 0, cn)
+
+
+@functools.lru_cache(maxsize=1)
+def _bulk_is_current() -> bool:
+    # Checked once per session: the shards match Scryfall's current default_cards file
+    marker = BULK_DIR / "_updated_at.txt"
+    if not marker.exists():
+        return False  # no bulk download yet
+    try:
+        meta = scry_get_json(f"{SCRYFALL_API}/bulk-data/default-cards")
+        return marker.read_text(encoding="utf-8") == (meta.get("updated_at") or "")
+    except (requests.exceptions.RequestException, OSError, ValueError):
+        return False
+
+
+# set code (lower) -> cards already read from its shard this session
+_BY_SET: Dict[str, List[dict]] = {}
+
+
+def bulk_cards_for_set(set_code: str) -> Optional[List[dict]]:
+    """
+    Cards of one set from the local bulk shards, in collector-number order.
+    Only used while the shards are current (one small /bulk-data call per session
+    instead of every search page); None => use the search API.
+    """
+    key = set_code.lower()
+    if key in _BY_SET:
+        return _BY_SET[key]
+    shard = BULK_DIR / f"set_{key}.jsonl"
+    if not shard.exists() or not _bulk_is_current():
+        return None  # a set newer than the bulk file, or stale / missing shards
+    try:
+        with open(shard, "r", encoding="utf-8") as f:
+            cards = [json.loads(line) for line in f if line.strip()]
+    except (OSError, ValueError):
+        return None
+    cards.sort(key=_collector_key)
+    _BY_SET[key] = cards
+    return cards
+
+
 def search_cards(set_code: str) -> List[dict]:
+    bulk = bulk_cards_for_set(set_code)
+    if bulk is not None:
+        return bulk
+
     cards = []
     page = 1
     while True:
@@ -493,63 +667,84 @@ def preferred_title(card: dict) -> str:
     return (card.get("flavor_name") or card.get("printed_name") or card.get("name") or "Unknown").strip()
 
 
+# Best image first: PNG (full border) and then the JPG sizes as fallback
+_URI_PRIORITY = ("png", "large", "normal", "small")
+
+
 def pick_png_uri(uris: Optional[Dict]) -> Optional[str]:
     if not uris:
         return None
-    return uris.get("png") or uris.get("large") or uris.get("normal") or uris.get("small")
-
+    for key in _URI_PRIORITY:
+        url = uris.get(key)
+        if url:
+            return url
+    return None
 
-def build_entries(card: dict) -> List[Entry]:
-    out: List[Entry] = []
 
-    if card.get("image_uris"):
-        url = pick_png_uri(card.get("image_uris"))
+def build_entries(card: dict) -> Iterator[Entry]:
+    uris = card.get("image_uris")
+    if uris:
+        url = pick_png_uri(uris)
         if url:
-            out.append(Entry(url, preferred_title(card)))
-        return out
+            yield Entry(url, preferred_title(card))
+        return
 
     # DFC / faces
-    for f in card.get("card_faces", []) or []:
+    for f in card.get("card_faces") or ():
         url = pick_png_uri(f.get("image_uris"))
         if url:
-            out.append(Entry(url, preferred_title(f)))
-
-    return out
+            yield Entry(url, preferred_title(f))
 
 
 # ------------------------------------------------------------
 # File naming helpers (handles duplicates: Name2, Name3, ...)
 # ------------------------------------------------------------
-def next_available_path(folder: Path, base_name: str, ext: str, mode: str) -> Path:
+def nth_print_path(folder: Path, base_name: str, ext: str, n: int) -> Path:
+    """Path of the n-th print (1-based) of a name within a set: Name, Name2, Name3..."""
+    base = slugify(base_name)
+    return folder / (f"{base}.fullborder{ext}" if n == 1 else f"{base}{n}.fullborder{ext}")
+
+
+def next_available_path(folder: Path, base_name: str, ext: str, mode: str, taken: Optional[set] = None) -> Path:
     """
     mode:
-      - "skip": if Name exists, use Name2/Name3... (preserves all prints)
+      - "keep-all": if Name exists, use Name2/Name3... (adds a new copy of every print)
       - "overwrite": always use Name (overwrite)
+    taken: os.path.normcase'd file names already in the folder or handed out in
+           this run (probed in memory); when None, each candidate is checked on disk.
     """
     base = slugify(base_name)
 
     if mode == "overwrite":
         return folder / f"{base}.fullborder{ext}"
 
-    candidate = folder / f"{base}.fullborder{ext}"
-    if not candidate.exists():
-        return candidate
+    def free(name: str) -> bool:
+        return os.path.normcase(name) not in taken if taken is not None else not (folder / name).exists()
+
+    name = f"{base}.fullborder{ext}"
+    if free(name):
+        return folder / name
 
     i = 2
     while True:
-        candidate = folder / f"{base}{i}.fullborder{ext}"
-        if not candidate.exists():
-            return candidate
+        name = f"{base}{i}.fullborder{ext}"
+        if free(name):
+            return folder / name
         i += 1
 
 
 def folder_has_files(p: Path) -> bool:
-    return p.exists() and any(p.iterdir())
+    # Only the first entry is needed
+    try:
+        with os.scandir(p) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
 
 
 def choose_folder_mode(set_dir: Path) -> str:
     """
-    Returns: "skip" | "overwrite" | "clean"
+    Returns: "skip" | "overwrite" | "clean" | "keep-all"
     """
     if not folder_has_files(set_dir):
         return "skip"
@@ -560,18 +755,21 @@ def choose_folder_mode(set_dir: Path) -> str:
             "",
             f"{CYAN}{set_dir}{RESET}",
             "",
-            "1) Skip existing (default)  → keeps ALL prints (Name2/Name3...)",
+            "1) Skip existing (default)  → downloads only missing prints (Name/Name2/Name3...)",
             "2) Overwrite existing       → replaces Name.fullborder.png",
             "3) Clean folder & redownload",
+            "4) Keep all + new copies    → saves every print again after the existing ones",
         ],
         color=YELLOW,
     )
 
-    opt = input("Choose [1-3]: ").strip()
+    opt = input("Choose [1-4]: ").strip()
     if opt == "2":
         return "overwrite"
     if opt == "3":
         return "clean"
+    if opt == "4":
+        return "keep-all"
     return "skip"
 
 
@@ -641,51 +839,85 @@ def run_download_for_set(sets: List[dict]) -> None:
     downloaded = 0
     skipped = 0
     errors = 0
-    log: List[str] = []
     log_path = out_dir / f"errors_{set_code}.log.txt"
+    log_file = None  # opened on the first error, line-buffered (kept even if the run is cut short)
 
-    pbar = tqdm(cards, desc=f"[{set_code}] downloading", unit="card", dynamic_ncols=True)
-    for card in pbar:
-        entries = build_entries(card)
-        if not entries:
+    def log_error(line: str) -> None:
+        nonlocal log_file
+        try:
+            if log_file is None:
+                log_file = open(log_path, "w", encoding="utf-8", buffering=1)
+            log_file.write(line + "\n")
+        except OSError:
+            pass  # the log is best-effort
+
+    # Paths are resolved up front, in card order, so Name2/Name3... numbering
+    # doesn't depend on which download finishes first.
+    # If skip: the n-th print of a name is NameN; already on disk => no download.
+    # If overwrite: we always write (the last print with a given name wins).
+    # If keep-all: we always write (path will be Name2/Name3... after existing files).
+    jobs: Dict[Path, Entry] = {}
+    print_counts: Dict[str, int] = {}
+    taken = set()
+    with os.scandir(out_dir) as it:
+        for d in it:
+            if d.name.endswith(".part"):
+                # left behind by an interrupted run (Ctrl+C mid-stream): never a finished image
+                try:
+                    os.unlink(d.path)
+                except OSError:
+                    pass
+                continue
+            taken.add(os.path.normcase(d.name))
+    for card in cards:
+        has_entry = False
+        for e in build_entries(card):
+            has_entry = True
+            if mode == "skip":
+                key = slugify(e.name)
+                n = print_counts[key] = print_counts.get(key, 0) + 1
+                path = nth_print_path(out_dir, e.name, ".png", n)
+                if os.path.normcase(path.name) in taken:
+                    skipped += 1
+                    continue
+            else:
+                path = next_available_path(out_dir, e.name, ".png", mode, taken)
+                taken.add(os.path.normcase(path.name))
+                if path in jobs:
+                    skipped += 1  # overwrite: an earlier print with this name is superseded
+            jobs[path] = e
+        if not has_entry:
             skipped += 1
-            continue
-
-        for e in entries:
-            try:
-                ext = ".png"
-                path = next_available_path(out_dir, e.name, ext, mode)
-
-                # If overwrite: we always write.
-                # If skip: we always write too (path will be Name2/Name3... if needed).
-                content = download_bytes_with_retry(e.url)
-
-                with open(path, "wb") as f:
-                    f.write(content)
-
-                downloaded += 1
-
-            except requests.exceptions.HTTPError as ex:
-                errors += 1
-                status = ex.response.status_code if getattr(ex, "response", None) is not None else "?"
-                log.append(f"[HTTP {status}] {e.name} -> {e.url} :: {ex}")
 
-            except Exception as ex:
-                errors += 1
-                log.append(f"[EXCEPTION] {e.name} -> {e.url} :: {ex}")
-
-    pbar.close()
+    pbar = tqdm(total=len(jobs), desc=f"[{set_code}] downloading", unit="img", dynamic_ncols=True)
+    try:
+        with ThreadPoolExecutor(max_workers=DL_WORKERS) as pool:
+            # Each worker owns its path, so bytes go straight from the socket to disk.
+            futures = {pool.submit(download_to_path, e.url, path): (e, path) for path, e in jobs.items()}
+            for fut in as_completed(futures):
+                e, path = futures[fut]
+                try:
+                    fut.result()
+                    downloaded += 1
+
+                except requests.exceptions.HTTPError as ex:
+                    errors += 1
+                    status = ex.response.status_code if getattr(ex, "response", None) is not None else "?"
+                    log_error(f"[HTTP {status}] {e.name} -> {e.url} :: {ex}")
+
+                except Exception as ex:
+                    errors += 1
+                    log_error(f"[EXCEPTION] {e.name} -> {e.url} :: {ex}")
+
+                pbar.update(1)
+    finally:
+        pbar.close()
+        if log_file is not None:
+            log_file.close()
 
     elapsed = time.time() - start
     avg_speed = downloaded / elapsed if elapsed > 0 else 0.0
 
-    if log:
-        try:
-            with open(log_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(log))
-        except Exception:
-            pass
-
     # Final box
     lines = [
         f"{GREEN}{BRIGHT}SET {set_code} completed{RESET}",
@@ -696,7 +928,7 @@ def run_download_for_set(sets: List[dict]) -> None:
         f"Errors: {RED}{errors}{RESET}",
         f"Elapsed time: {CYAN}{format_duration(elapsed)}{RESET}",
         f"Average speed: {CYAN}{avg_speed:.2f} images/s{RESET}",
-        (f"Error log: {log_path}" if log else "No errors recorded."),
+        (f"Error log: {log_path}" if log_file is not None else "No errors recorded."),
         f"Output: {CYAN}{out_dir}{RESET}",
     ]
     box(lines, color=YELLOW)
@@ -714,6 +946,7 @@ def main():
 
 
     sets = get_all_sets()
+    precompute_norms(sets)
 
     while True:
         run_download_for_set(sets)
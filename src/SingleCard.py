@@ -7,14 +7,23 @@
 #      batch SET download, Singles integration and Token/Audit support.
 # ============================================================
 
+import os
+import sys
 import re
+import json
+import hashlib
+import shutil
 import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, NamedTuple
 from tqdm import tqdm
 from PIL import Image
 from io import BytesIO
+from urllib.parse import quote
 
 # ---------- UI ----------
 try:
@@ -30,16 +39,18 @@ try:
 except Exception:
     PINK = GREEN = CYAN = YELLOW = RED = BRIGHT = RESET = ""
 
-_ansi_re = re.compile(r"\x1b\[[0-9;]*m")
-def _len_vis(s: str) -> int: return len(_ansi_re.sub("", s))
+_ansi_re = re.compile(r"\x1b\[[0-9;]*m", re.ASCII)
+def _len_vis(s: str) -> int: return len(_ansi_re.sub("", s)) if "\x1b" in s else len(s)
 
 def box(lines: List[str], color=CYAN):
-    w = max(_len_vis(t) for t in lines) if lines else 0
-    print(color + "╔" + "═" * (w + 2) + "╗" + RESET)
-    for t in lines:
-        pad = w - _len_vis(t)
-        print(color + "║ " + RESET + t + " " * pad + color + " ║" + RESET)
-    print(color + "╚" + "═" * (w + 2) + "╝" + RESET)
+    # largura de cada linha medida uma vez; moldura inteira sai num único write
+    widths = [_len_vis(t) for t in lines]
+    w = max(widths, default=0)
+    parts = [color + "╔" + "═" * (w + 2) + "╗" + RESET]
+    for t, vw in zip(lines, widths):
+        parts.append(color + "║ " + RESET + t + " " * (w - vw) + color + " ║" + RESET)
+    parts.append(color + "╚" + "═" * (w + 2) + "╝" + RESET)
+    sys.stdout.write("\n".join(parts) + "\n")
 
 def banner():
     title = "bconti Single Card Scrapper"
@@ -59,10 +70,11 @@ def singles_root() -> Path:
 
 def ensure_dir(p: Path): p.mkdir(parents=True, exist_ok=True)
 
-INVALID_CHARS_PATTERN = r'[<>:"/\\|?*\x00-\x1F]'
+# ":" vira "-"; demais inválidos no Windows + caracteres de controle viram "_" (uma passada em C)
+_SLUG_TABLE = str.maketrans({**dict.fromkeys('<>"/\\|?*' + "".join(map(chr, range(32))), "_"), ":": "-"})
 def slugify_filename(name: str) -> str:
-    name = (name or "").replace(":", "-").strip()
-    return re.sub(INVALID_CHARS_PATTERN, "_", name)
+    # strip antes: ":"→"-" não mexe em espaço, e tabs/quebras nas pontas somem como antes
+    return (name or "").strip().translate(_SLUG_TABLE)
 
 def infer_ext(url: str) -> str:
     return ".png" if ".png" in (url or "").lower() else ".jpg"
@@ -70,8 +82,79 @@ def infer_ext(url: str) -> str:
 # ---------- HTTP / Scryfall ----------
 SCRYFALL_API = "https://api.scryfall.com"
 RATE_SLEEP = 0.12
+DL_WORKERS = 8  # downloads em paralelo (ALL prints)
+TIMEOUT = 30  # segundos por requisição à API
+DL_TIMEOUT = 20  # segundos por imagem
+STREAM_CHUNK = 64 * 1024  # bloco ao gravar a resposta direto no disco
+SEARCH_PAGE_SIZE = 175  # cartas por página em /cards/search
+SEARCH_WORKERS = 4  # páginas de busca em paralelo
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": "ForgeImageFetcher/1.7 (bconti-scrapper)"})
+# Retry em 429/5xx fica em http_get, não num adapter: aberto pelo Downloader, este módulo usa a
+# SESSION compartilhada dele (a nossa é trocada no import), e a política precisa ir junto.
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+HTTP_RETRIES = 5
+RETRY_BACKOFF = 0.25  # segundos; dobra a cada tentativa
+RETRY_AFTER_MAX = 60.0
+
+def _mount_pool() -> None:
+    """Pool maior (threads de download) — só na execução standalone, quando a SESSION é a nossa."""
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    SESSION.mount("https://", adapter)
+    SESSION.mount("http://", adapter)
+
+def _retry_wait(r: requests.Response, attempt: int) -> float:
+    try:
+        return min(float(r.headers.get("Retry-After", "")), RETRY_AFTER_MAX)
+    except ValueError:  # ausente ou em formato de data
+        return RETRY_BACKOFF * (2 ** attempt)
+
+def http_get(url: str, **kw) -> requests.Response:
+    """
+    SESSION.get com retry em falha de conexão e em 429/5xx (respeitando Retry-After).
+    Esgotadas as tentativas, a última resposta volta e o chamador trata o status.
+    """
+    for attempt in range(HTTP_RETRIES + 1):
+        try:
+            r = SESSION.get(url, **kw)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == HTTP_RETRIES:
+                raise
+            time.sleep(RETRY_BACKOFF * (2 ** attempt))
+            continue
+        if r.status_code not in RETRY_STATUS or attempt == HTTP_RETRIES:
+            return r
+        wait = _retry_wait(r, attempt)
+        r.close()
+        time.sleep(wait)
+    raise RuntimeError("http_get: unreachable")
+
+class TokenBucket:
+    """
+    Limitador compartilhado entre threads: `rate` tokens/s, até `capacity` acumulados.
+    acquire() reserva o token sob o lock e dorme fora dele.
+    """
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait_s = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_s > 0:
+            time.sleep(wait_s)
+
+# Busca na API: uma chamada a cada RATE_SLEEP (antes: sleep fixo depois de cada GET)
+API_LIMITER = TokenBucket(rate=1 / RATE_SLEEP, capacity=1)
+# Downloads de imagem: no total ~1/RATE_SLEEP req/s, qualquer que seja o nº de threads
+IMG_LIMITER = TokenBucket(rate=1 / RATE_SLEEP, capacity=DL_WORKERS)
 
 
 # ---------- Entradas de imagem ----------
@@ -113,74 +196,187 @@ def pick_image_entries(card: dict) -> List[ImgEntry]:
         if u: entries.append(ImgEntry(u, None))
     return entries
 
+# JPEG regravado (cartas giradas): 4:2:0, mesmo perfil do Downloader.py
+JPEG_QUALITY = 90
+JPEG_SUBSAMPLING = 2
+# Huffman otimizado: ~5% menor, sem perda, ~1 ms a mais por imagem — aqui só as poucas cartas giradas
+# passam pelo encoder (no Downloader.py, em lote, fica desligado). Progressivo custaria ~3x o tempo.
+JPEG_OPTIMIZE = True
+
+# Únicos layouts que podem precisar de giro de 90° (imagem deitada)
+ROTATABLE_LAYOUTS = frozenset({"split", "aftermath", "flip"})
+
+def may_rotate_h90(card: Optional[dict]) -> bool:
+    return ((card or {}).get("layout") or "").lower() in ROTATABLE_LAYOUTS
+
 def should_rotate_h90(card: dict, img: Image.Image) -> bool:
-    layout = (card.get("layout") or "").lower()
-    if layout not in {"split", "aftermath", "flip"}: return False
+    if not may_rotate_h90(card): return False
     w, h = img.size
     return w > h
 
 def save_image(content: bytes, out_path: Path, card=None, rotate_mode: Optional[str] = None):
+    # Caso comum (sem giro possível): grava os bytes como vieram, sem abrir no PIL
+    if rotate_mode is None and not may_rotate_h90(card):
+        with open(out_path, "wb") as f: f.write(content)
+        return
     try:
         img = Image.open(BytesIO(content))
+        # transpose = giro exato (cópia de pixels, sem interpolação); RGB só se precisar
         if rotate_mode == "rot180":
-            img = img.rotate(180, expand=True).convert("RGB")
-            img.save(out_path.with_suffix(".jpg"), quality=95, subsampling=0)
-            return
-        if should_rotate_h90(card, img):
-            img = img.rotate(90, expand=True).convert("RGB")
-            img.save(out_path.with_suffix(".jpg"), quality=95, subsampling=0)
+            op = Image.Transpose.ROTATE_180
+        elif should_rotate_h90(card, img):
+            op = Image.Transpose.ROTATE_90
+        else:
+            op = None
+        if op is not None:
+            img = img.transpose(op)
+            if img.mode != "RGB":
+                img = img.convert("RGB")
+            img.save(out_path.with_suffix(".jpg"), quality=JPEG_QUALITY, subsampling=JPEG_SUBSAMPLING,
+                     optimize=JPEG_OPTIMIZE)
             return
     except Exception:
         pass
     with open(out_path, "wb") as f: f.write(content)
 
+# ---------- Cache da busca (disco) ----------
+SEARCH_CACHE_DIR = Path(__file__).resolve().parent / "cache" / "search"
+SEARCH_CACHE_TTL = 24 * 3600  # segundos
+
+def _search_cache_path(name: str) -> Path:
+    key = hashlib.blake2b(name.strip().lower().encode("utf-8"), digest_size=16).hexdigest()
+    return SEARCH_CACHE_DIR / f"{key}.json"
+
+def _read_search_cache(name: str) -> Optional[List[dict]]:
+    p = _search_cache_path(name)
+    try:
+        if time.time() - p.stat().st_mtime > SEARCH_CACHE_TTL:
+            return None
+        return json.loads(p.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+def _write_search_cache(name: str, cards: List[dict]) -> None:
+    p = _search_cache_path(name)
+    try:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_suffix(".tmp")
+        tmp.write_text(json.dumps(cards), encoding="utf-8")
+        os.replace(tmp, p)
+    except OSError:
+        pass  # cache é só atalho
+
 # ---------- Scryfall search ----------
 def scry_search_by_name_all_prints(name: str) -> List[dict]:
+    # Mesma busca nas últimas 24h → resultado do disco, sem paginar a API de novo
+    cached = _read_search_cache(name)
+    if cached is not None:
+        return cached
+    cards = _scry_search_by_name_all_prints(name)
+    if cards:  # "sem resultado" não fica em cache (carta nova pode aparecer a qualquer hora)
+        _write_search_cache(name, cards)
+    return cards
+
+def _search_base(q: str) -> str:
+    """URL de /cards/search sem o número da página; q é codificada uma vez só por busca."""
+    return f"{SCRYFALL_API}/cards/search?q={quote(q, safe='')}&order=set&dir=asc&page="
+
+def _search_page(base: str, page: int) -> Optional[dict]:
+    """Uma página de /cards/search; None em 404 (sem resultados)."""
+    API_LIMITER.acquire()
+    r = http_get(f"{base}{page}", timeout=TIMEOUT)
+    if r.status_code == 404: return None
+    r.raise_for_status()
+    return r.json()
+
+def _search_all_pages(q: str) -> List[dict]:
+    """
+    Página 1 traz total_cards → páginas 2..N saem juntas (ainda no ritmo do API_LIMITER),
+    em vez de uma por vez esperando has_more.
+    """
+    base = _search_base(q)
+    first = _search_page(base, 1)
+    if first is None: return []
+    cards: List[dict] = list(first.get("data", []))
+    if not first.get("has_more"): return cards
+
+    total = first.get("total_cards")
+    if not isinstance(total, int):
+        # sem total para planejar: segue has_more página a página
+        page, js = 1, first
+        while js is not None and js.get("has_more"):
+            page += 1
+            js = _search_page(base, page)
+            if js is not None: cards.extend(js.get("data", []))
+        return cards
+
+    last_page = -(-total // SEARCH_PAGE_SIZE)
+    with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as ex:
+        for js in ex.map(lambda n: _search_page(base, n), range(2, last_page + 1)):  # map mantém a ordem
+            if js is not None: cards.extend(js.get("data", []))
+    return cards
+
+def _scry_search_by_name_all_prints(name: str) -> List[dict]:
     queries = [
         f'!"{name}" unique:prints include:extras include:variations',
         f'{name} unique:prints include:extras include:variations'
     ]
     for q in queries:
-        page = 1
-        cards: List[dict] = []
-        while True:
-            url = f"{SCRYFALL_API}/cards/search?q={requests.utils.quote(q)}&order=set&dir=asc&page={page}"
-            r = SESSION.get(url)
-            time.sleep(RATE_SLEEP)
-            if r.status_code == 404: break
-            r.raise_for_status()
-            js = r.json()
-            cards.extend(js.get("data", []))
-            if not js.get("has_more"): break
-            page += 1
+        cards = _search_all_pages(q)
         if cards: return cards
     return []
 
 # ---------- Scanner da pasta ----------
-# Formato de stem (sem extensão): SET_Nome[2|3|...].fullborder
-STEM_RE = re.compile(
-    r'^(?P<set>[A-Z0-9]{2,5})_(?P<name>.+?)(?P<idx>\d+)?\.fullborder$',
-    flags=re.UNICODE
-)
+_SET_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+_FULLBORDER = ".fullborder"
+_MAX_INDEX = 1024  # teto do bitmask de índices (nenhuma carta tem tantos prints no mesmo set)
 
-def scan_existing(folder: Path) -> Dict[Tuple[str, str], set]:
+def parse_stem(stem: str) -> Optional[Tuple[str, str, int]]:
     """
-    Retorna mapa: (SET, slugified_name) -> {índices existentes}
+    Stem (nome sem extensão) no formato SET_Nome[2|3|...].fullborder → (SET, nome, índice) ou None.
+      - SET: 2 a 5 caracteres A-Z/0-9, antes do primeiro "_"
+      - nome: pelo menos 1 caractere; dígitos finais viram o índice (sem dígitos → 1)
+    Ex.: "LEA_Bolt3.fullborder" → ("LEA", "Bolt", 3)
     """
-    found: Dict[Tuple[str, str], set] = {}
-    for p in folder.glob("*.*"):
-        lp = p.name.lower()
-        if not (lp.endswith(".fullborder.jpg") or lp.endswith(".fullborder.png")):
-            continue
-        stem = p.with_suffix("").name  # remove .jpg/.png
-        m = STEM_RE.match(stem)
-        if not m:  # não aderente ao padrão
-            continue
-        set_code = m.group("set").upper()
-        name_part = m.group("name")  # já está no formato de arquivo
-        idx = int(m.group("idx")) if m.group("idx") else 1
-        key = (set_code, name_part)
-        found.setdefault(key, set()).add(idx)
+    if not stem.endswith(_FULLBORDER):
+        return None
+    i = stem.find("_")
+    if not (2 <= i <= 5) or not _SET_CHARS.issuperset(stem[:i]):
+        return None
+    rest = stem[i + 1:-len(_FULLBORDER)]
+    if not rest:
+        return None
+    # dígitos finais = índice (o nome fica com pelo menos 1 caractere)
+    j = len(rest)
+    while j > 1 and rest[j - 1].isdecimal():
+        j -= 1
+    if "\n" in rest[:j]:
+        return None
+    return stem[:i], rest[:j], int(rest[j:]) if j < len(rest) else 1
+
+def scan_existing(folder: Path, names_out: Optional[set] = None) -> Dict[Tuple[str, str], int]:
+    """
+    Retorna mapa: (SET, slugified_name) -> bitmask dos índices existentes (bit i-1 = índice i)
+    names_out (opcional): recebe o nome (os.path.normcase) de TODO arquivo da pasta,
+    inclusive os que o padrão não reconhece (ex.: nome de carta terminando em dígito).
+    """
+    found: Dict[Tuple[str, str], int] = {}
+    with os.scandir(folder) as it:  # só nomes: sem stat por arquivo
+        for entry in it:
+            n = entry.name
+            if names_out is not None:
+                names_out.add(os.path.normcase(n))
+            lp = n[-15:].lower()
+            if lp != ".fullborder.jpg" and lp != ".fullborder.png":
+                continue
+            parsed = parse_stem(n[:-4])  # remove .jpg/.png
+            if parsed is None:  # não aderente ao padrão
+                continue
+            set_code, name_part, idx = parsed  # name_part já está no formato de arquivo
+            if not 1 <= idx <= _MAX_INDEX:  # "Nome0" / "Nome2024": nunca é índice planejado (names_out cobre)
+                continue
+            key = (set_code, name_part)
+            found[key] = found.get(key, 0) | (1 << (idx - 1))
     return found
 
 # ---------- Planejamento determinístico ----------
@@ -189,6 +385,29 @@ class PlannedFile(NamedTuple):
     path: Path
     rotate: Optional[str]
     card: dict
+    h90: bool  # layout pode vir deitado (decidido no plano, não a cada imagem)
+
+class CardPlanInfo(NamedTuple):
+    card: dict
+    key: Tuple[str, str]  # (SET, nome slug) — igual ao arquivo
+    entries: List[ImgEntry]
+    h90: bool
+
+# Lista de prints da busca atual: ALL e ONE (várias vezes) reaproveitam o mesmo cálculo
+_CARD_INFO: Dict[int, CardPlanInfo] = {}
+
+def card_plan_info(card: dict) -> CardPlanInfo:
+    info = _CARD_INFO.get(id(card))
+    if info is not None and info.card is card:
+        return info
+    key = ((card.get("set") or "").upper(), slugify_filename(canonical_single_name(card)))
+    return CardPlanInfo(card, key, pick_image_entries(card), may_rotate_h90(card))
+
+def precompute_entries(cards: List[dict]) -> None:
+    """Calcula uma vez, por carta da lista atual, chave do arquivo, entradas de imagem e flag de giro."""
+    _CARD_INFO.clear()
+    for card in cards:
+        _CARD_INFO[id(card)] = card_plan_info(card)
 
 def base_noext_for(set_code: str, name: str, index: int) -> str:
     set_code = (set_code or "").upper()
@@ -207,16 +426,17 @@ def build_plan_from_selection(selected_cards: List[dict], out_dir: Path) -> Tupl
     Retorna (plan, skipped_existing_total)
     """
     ensure_dir(out_dir)
-    existing = scan_existing(out_dir)
+    existing_names: set = set()
+    existing = scan_existing(out_dir, existing_names)
 
     # 1) montar lista ordenada de entradas por chave
     per_key_entries: Dict[Tuple[str, str], List[Tuple[dict, ImgEntry]]] = {}
+    h90_of: Dict[int, bool] = {}
     for card in selected_cards:
-        set_code = (card.get("set") or "").upper()
-        name = slugify_filename(canonical_single_name(card))  # <- chave usa slug igual ao arquivo
-        key = (set_code, name)
-        for e in pick_image_entries(card):
-            per_key_entries.setdefault(key, []).append((card, e))
+        info = card_plan_info(card)
+        h90_of[id(card)] = info.h90
+        for e in info.entries:
+            per_key_entries.setdefault(info.key, []).append((card, e))
 
     # 2) para cada chave, indices desejados = 1..len(lst)
     plan: List[PlannedFile] = []
@@ -225,35 +445,161 @@ def build_plan_from_selection(selected_cards: List[dict], out_dir: Path) -> Tupl
         set_code, name_slug = key
         desired_total = len(lst)
         desired_indices = list(range(1, desired_total + 1))
-        existing_indices = existing.get(key, set())
+        existing_mask = existing.get(key, 0)
 
         # Associa entradas aos índices desejados em ordem estável
         for desired_idx, (card, entry) in zip(desired_indices, lst):
             base_noext = base_noext_for(set_code, name_slug, desired_idx)
             ext = infer_ext(entry.url)
             out_path = out_dir / f"{base_noext}{ext}"
-            if desired_idx in existing_indices or out_path.exists():
+            # o nome exato cobre o que o parse do padrão não enxerga; tudo em memória, sem stat
+            if existing_mask >> (desired_idx - 1) & 1 or os.path.normcase(out_path.name) in existing_names:
                 skipped_total += 1
                 continue
-            plan.append(PlannedFile(entry.url, out_path, entry.rotate, card))
+            plan.append(PlannedFile(entry.url, out_path, entry.rotate, card, h90_of[id(card)]))
 
     return plan, skipped_total
 
+# ---------- Dedup por conteúdo ----------
+# Download sem giro vira blob cache/blobs/<hash>: o arquivo final é hardlink do blob (mesma arte
+# em outra URL só aponta pro blob, sem cópia a mais). Imagens giradas não geram blob — o arquivo
+# final já não é o original e guardar os bytes seria uma cópia extra. URL já vista não vai à rede:
+# as do Scryfall trazem versão (?timestamp), então nem revalidação (ETag/304) é necessária.
+# Blob e arquivo final dividem o mesmo inode: antes de reusar, o hash do blob é conferido com o
+# nome; se não bate (arquivo editado/corrompido), a entrada sai do índice e a URL é baixada de novo.
+# Apagar a pasta cache/blobs libera o espaço dos blobs e só desliga o atalho.
+BLOB_DIR = Path(__file__).resolve().parent / "cache" / "blobs"
+BLOB_INDEX = BLOB_DIR / "index.json"  # url -> hash do conteúdo
+
+def _load_blob_index() -> Dict[str, str]:
+    try:
+        return json.loads(BLOB_INDEX.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def _save_blob_index(blobs: Dict[str, str]) -> None:
+    try:
+        BLOB_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = BLOB_INDEX.with_suffix(".tmp")
+        tmp.write_text(json.dumps(blobs), encoding="utf-8")
+        os.replace(tmp, BLOB_INDEX)
+    except OSError:
+        pass  # índice é só atalho
+
+def _link_from_blob(blob: Path, out_path: Path) -> None:
+    tmp = out_path.with_name(out_path.name + ".part")
+    try:
+        os.link(blob, tmp)
+    except OSError:  # outro disco / FS sem hardlink → cópia local ainda evita a rede
+        shutil.copyfile(blob, tmp)
+    os.replace(tmp, out_path)
+
+def _blob_ok(digest: str) -> bool:
+    """Confere o conteúdo do blob com o hash do nome (o inode é compartilhado com arquivos de saída)."""
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(BLOB_DIR / digest, "rb") as f:
+            for chunk in iter(lambda: f.read(STREAM_CHUNK), b""):
+                h.update(chunk)
+    except OSError:
+        return False
+    return h.hexdigest() == digest
+
+def _drop_blob(digest: str) -> None:
+    try:
+        (BLOB_DIR / digest).unlink()
+    except OSError:
+        pass
+
+def _adopt_blob(out_path: Path, digest: str) -> bool:
+    """Liga out_path ao blob do conteúdo (reaproveita o existente ou cria). True se o blob ficou válido."""
+    blob = BLOB_DIR / digest
+    try:
+        BLOB_DIR.mkdir(parents=True, exist_ok=True)
+        if blob.is_file():
+            if os.path.samefile(blob, out_path):
+                return True
+            if _blob_ok(digest):
+                _link_from_blob(blob, out_path)  # cópia repetida some: os dois nomes, um só conteúdo
+                return True
+            _drop_blob(digest)  # blob estragado: o download novo assume o lugar
+        os.link(out_path, blob)
+        return True
+    except OSError:
+        return False
+
 # ---------- Execução ----------
+def _fetch_one(pf: PlannedFile, blobs: Dict[str, str]) -> bool:
+    part = pf.path.with_name(pf.path.name + ".part")
+    try:
+        plain = pf.rotate is None and not pf.h90
+        known = blobs.get(pf.url)
+        if known:  # URL já baixada antes: corpo local, sem GET — se o blob ainda confere
+            if _blob_ok(known):
+                try:
+                    if plain:
+                        _link_from_blob(BLOB_DIR / known, pf.path)
+                    else:
+                        save_image((BLOB_DIR / known).read_bytes(), pf.path, card=pf.card, rotate_mode=pf.rotate)
+                    return True
+                except OSError:
+                    pass  # blob sumiu no meio do caminho → rede
+            else:
+                blobs.pop(pf.url, None)
+                _drop_blob(known)
+        IMG_LIMITER.acquire()
+        with http_get(pf.url, stream=True, timeout=DL_TIMEOUT) as r:
+            if r.status_code != 200:
+                return False
+            if plain:
+                # Sem giro: do socket direto pro arquivo (.part → nome final), sem r.content;
+                # o hash sai no mesmo laço, sem reler o arquivo
+                r.raw.decode_content = True
+                h = hashlib.blake2b(digest_size=16)
+                size = 0
+                with open(part, "wb") as f:
+                    for chunk in iter(lambda: r.raw.read(STREAM_CHUNK), b""):
+                        h.update(chunk)
+                        f.write(chunk)
+                        size += len(chunk)
+                # corpo cortado não pode virar blob (o hash bateria com os bytes truncados)
+                expected = r.headers.get("Content-Length")
+                if expected and not r.headers.get("Content-Encoding") and int(expected) != size:
+                    part.unlink()
+                    return False
+                os.replace(part, pf.path)
+                digest = h.hexdigest()
+                if _adopt_blob(pf.path, digest):
+                    blobs[pf.url] = digest
+                return True
+            # Giro precisa da imagem inteira na memória; o arquivo final não é o original → sem blob
+            save_image(r.content, pf.path, card=pf.card, rotate_mode=pf.rotate)
+            return True
+    except Exception:
+        try:
+            part.unlink()
+        except OSError:
+            pass
+        return False
+
 def execute_plan(plan: List[PlannedFile]) -> Tuple[int, int]:
     downloaded = 0
     errors = 0
-    for pf in tqdm(plan, desc="Downloading", unit="img"):
-        try:
-            with SESSION.get(pf.url, stream=True) as r:
-                time.sleep(RATE_SLEEP)
-                if r.status_code != 200:
-                    errors += 1
-                    continue
-                save_image(r.content, pf.path, card=pf.card, rotate_mode=pf.rotate)
+    blobs = _load_blob_index()
+    # Cada PlannedFile já tem caminho definitivo e único → as threads não disputam arquivos.
+    # Barra redesenha no máximo ~200 vezes (e a cada 0.2s): com blobs locais o terminal virava o gargalo.
+    bar = tqdm(total=len(plan), desc="Downloading", unit="img",
+               miniters=max(1, len(plan) // 200), mininterval=0.2)
+    with ThreadPoolExecutor(max_workers=DL_WORKERS) as ex, bar:
+        # por URL: mesmo host/caminho em sequência nas conexões keep-alive (o destino de cada um não muda)
+        futs = [ex.submit(_fetch_one, pf, blobs) for pf in sorted(plan, key=lambda pf: pf.url)]
+        for fut in as_completed(futs):
+            if fut.result():
                 downloaded += 1
-        except Exception:
-            errors += 1
+            else:
+                errors += 1
+            bar.update(1)
+    _save_blob_index(blobs)
     return downloaded, errors
 
 # ---------- UI helpers ----------
@@ -304,7 +650,8 @@ def singlecard_intro_box(out_dir: Path):
         f"{YELLOW}Examples:{RESET} Lightning Bolt, Birds of Paradise, Assassin's Trophy",
         "",
         f"{CYAN}Saving pattern:{RESET} <SET>_<Name>[2|3...].fullborder.<ext>",
-        f"{CYAN}Folder:{RESET} {out_dir}"
+        f"{CYAN}Folder:{RESET} {out_dir}",
+        f"{CYAN}Cache:{RESET} {BLOB_DIR} (re-runs reuse it; delete to force fresh downloads)"
     ], CYAN)
 
 def canonical_single_name(card: dict) -> str:
@@ -425,6 +772,7 @@ def singlecard_menu(_base: Path):
             box([f"No results for: {name}"], RED)
             # volta para a tela de intro, sem sair do Singles
             continue
+        precompute_entries(cards)
 
         disp = slugify_filename(cards[0].get("name") or name)
 
@@ -511,6 +859,7 @@ def singlecard_menu(_base: Path):
 
 # ---------- Standalone ----------
 def main():
+    _mount_pool()
     banner()
     singlecard_menu(Path.cwd())
 
@@ -11,18 +11,23 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import io
 import json
+import operator
 import os
 import random
 import re
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Optional: PIL for rotation logic (flip rot180, split/aftermath h90). If not available, we skip rotation.
 try:
@@ -42,16 +47,54 @@ DL_RETRY = 6
 BACKOFF_BASE = 1.2
 BACKOFF_JITTER = 0.35
 
+# Keep-alive pool per host; sized in run_download to fit --threads.
+# (requests already sends Connection: keep-alive and Accept-Encoding: gzip, deflate.)
+HTTP_POOL_SIZE = 32
+
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": "ForgeFastCSV/0.1 (fast-manifest-downloader)"})
+# Downloader swaps SESSION for its shared one and owns that pool (its own ensure_pool_size);
+# we only ever resize the session we created.
+_OWN_SESSION = SESSION
+_pool_size = 0
+
+
+def ensure_pool_size(size: int) -> None:
+    """
+    Mount an adapter whose pool fits `size` concurrent workers; urllib3's default of 10 made
+    extra threads discard sockets and re-handshake. Retries stay in our own loops (max_retries=0).
+    No-op when SESSION was injected by another module.
+    """
+    global _pool_size
+    if SESSION is not _OWN_SESSION or size <= _pool_size:
+        return
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size, max_retries=0)
+    SESSION.mount("https://", adapter)
+    SESSION.mount("http://", adapter)
+    _pool_size = size
 
 
-INVALID_CHARS_PATTERN = r'[<>:"/\\|?*\x00-\x1F]'
+# Large read buffer for manifests (big sets => tens of thousands of rows)
+MANIFEST_READ_BUFFER = 1 << 20
 
+# Block size when streaming a download straight to disk
+STREAM_CHUNK = 1 << 16
 
+# state.jsonl: records batched and flushed every N so an interrupted run still resumes
+STATE_BUFFER = 1 << 16
+STATE_FLUSH_EVERY = 64
+
+INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+
+WINDOWS_RESERVED = frozenset(
+    {"CON", "PRN", "AUX", "NUL"} | {f"COM{i}" for i in range(1, 10)} | {f"LPT{i}" for i in range(1, 10)}
+)
+
+
+@functools.lru_cache(maxsize=8192)
 def slugify_filename(name: str) -> str:
     name = (name or "").replace(":", "-").strip()
-    name = re.sub(INVALID_CHARS_PATTERN, "_", name)
+    name = INVALID_CHARS_RE.sub("_", name)
     name = name.rstrip(" .")
     return name if name else "Unknown"
 
@@ -63,11 +106,10 @@ def safe_mkdir(p: Path) -> None:
 def is_windows_reserved(code: str) -> bool:
     if os.name != "nt":
         return False
-    c = (code or "").strip().upper()
-    reserved = {"CON", "PRN", "AUX", "NUL"} | {f"COM{i}" for i in range(1, 10)} | {f"LPT{i}" for i in range(1, 10)}
-    return c in reserved
+    return (code or "").strip().upper() in WINDOWS_RESERVED
 
 
+@functools.lru_cache(maxsize=256)
 def safe_set_folder_name(set_code: str) -> str:
     code = slugify_filename((set_code or "UNK").strip().upper())
     code = code.rstrip(" .")
@@ -97,11 +139,63 @@ def api_get_json(url: str, *, params: Optional[dict] = None) -> dict:
     raise last_exc or RuntimeError("api_get_json failed")
 
 
+class AdaptiveGate:
+    """
+    Caps concurrent image requests below the thread count when Scryfall pushes back (AIMD):
+    a 429 halves the limit (floor 2), every GROW_EVERY clean responses add one slot back,
+    up to the --threads cap. Workers wait for a slot only around the HTTP exchange,
+    never during their backoff sleep.
+    """
+    GROW_EVERY = 50
+
+    def __init__(self, cap: int):
+        self._cond = threading.Condition()
+        self._active = 0
+        self._streak = 0
+        self.reset(cap)
+
+    def reset(self, cap: int) -> None:
+        with self._cond:
+            self.cap = max(1, cap)
+            self.limit = self.cap
+            self._streak = 0
+            self._cond.notify_all()
+
+    def __enter__(self) -> "AdaptiveGate":
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        return self
+
+    def __exit__(self, *exc) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def record(self, status: int) -> None:
+        with self._cond:
+            if status == 429:
+                self.limit = max(min(2, self.cap), self.limit // 2)
+                self._streak = 0
+            elif status < 400:
+                self._streak += 1
+                if self._streak >= self.GROW_EVERY and self.limit < self.cap:
+                    self.limit += 1
+                    self._streak = 0
+                    self._cond.notify()
+
+
+DL_GATE = AdaptiveGate(HTTP_POOL_SIZE)
+
+
 def dl_get_bytes(url: str) -> bytes:
     last_exc: Optional[Exception] = None
     for attempt in range(1, DL_RETRY + 1):
         try:
-            r = SESSION.get(url, stream=True, timeout=DL_TIMEOUT)
+            with DL_GATE:
+                r = SESSION.get(url, timeout=DL_TIMEOUT)  # body read at once -> socket back in the pool
+            DL_GATE.record(r.status_code)
             if r.status_code == 429 or 500 <= r.status_code <= 599:
                 raise requests.exceptions.HTTPError(f"HTTP {r.status_code}", response=r)
             r.raise_for_status()
@@ -114,6 +208,38 @@ def dl_get_bytes(url: str) -> bytes:
     raise last_exc or RuntimeError("dl_get_bytes failed")
 
 
+def dl_stream_to_file(url: str, final_path: Path) -> None:
+    """
+    Same retry loop as dl_get_bytes, but the body goes straight from the socket into
+    *.part (no whole-image bytes object), then renames to final.
+    The folder must exist (run_download creates out_dir once before the workers start).
+    """
+    tmp = final_path.with_suffix(final_path.suffix + ".part")
+    last_exc: Optional[Exception] = None
+    for attempt in range(1, DL_RETRY + 1):
+        try:
+            with DL_GATE, SESSION.get(url, stream=True, timeout=DL_TIMEOUT) as r:
+                DL_GATE.record(r.status_code)
+                if r.status_code == 429 or 500 <= r.status_code <= 599:
+                    raise requests.exceptions.HTTPError(f"HTTP {r.status_code}", response=r)
+                r.raise_for_status()
+                with open(tmp, "wb") as f:
+                    f.writelines(r.iter_content(STREAM_CHUNK))
+            os.replace(str(tmp), str(final_path))
+            return
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, requests.exceptions.HTTPError,
+                requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError, OSError) as e:
+            last_exc = e
+            if attempt == DL_RETRY:
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+                raise
+            sleep_backoff(attempt)
+    raise last_exc or RuntimeError("dl_stream_to_file failed")
+
+
 @dataclass(frozen=True)
 class ManifestRow:
     set_code: str
@@ -128,16 +254,24 @@ class ManifestRow:
     error: str
 
 
+# prefer large (fast default) then png
+_URI_PRIORITY = ("large", "png", "normal", "small")
+
+
 def from_uris(uris: Optional[dict]) -> Optional[str]:
     if not uris:
         return None
-    # prefer large (fast default) then png
-    return uris.get("large") or uris.get("png") or uris.get("normal") or uris.get("small")
+    for k in _URI_PRIORITY:
+        v = uris.get(k)
+        if v:
+            return v
+    return None
 
 
 def infer_ext(url: str) -> str:
-    u = (url or "").lower()
-    if ".png" in u:
+    u = url or ""
+    # Scryfall URLs are lowercase: the plain check decides; lower() copy only for mixed-case input
+    if ".png" in u or (not u.islower() and ".png" in u.lower()):
         return ".png"
     return ".jpg"
 
@@ -220,17 +354,19 @@ def build_target_filename(set_code: str, name: str, idx: int, ext: str) -> str:
       <Name>[2|3...].fullborder.<ext>
     idx starts at 1. idx==1 => no suffix. idx>=2 => suffix number.
     """
-    safe_name = slugify_filename(name)
-    suffix = "" if idx == 1 else str(idx)
-    return f"{safe_name}{suffix}.fullborder{ext}"
+    return build_target_filename_from_slug(slugify_filename(name), idx, ext)
+
 
+def build_target_filename_from_slug(safe_name: str, idx: int, ext: str) -> str:
+    """build_target_filename for a name that is already slugified (manifest build loop)."""
+    return f"{safe_name}.fullborder{ext}" if idx == 1 else f"{safe_name}{idx}.fullborder{ext}"
 
-def scryfall_cards_for_set(set_code: str) -> List[dict]:
+
+def iter_scryfall_cards_for_set(set_code: str) -> Iterator[dict]:
     """
-    One paginated call chain:
+    One paginated call chain, yielded page by page as it arrives:
     /cards/search?q=e:<set>&unique=prints&include_extras=true&include_variations=true
     """
-    cards: List[dict] = []
     page = 1
     while True:
         js = api_get_json(
@@ -245,49 +381,76 @@ def scryfall_cards_for_set(set_code: str) -> List[dict]:
                 "page": str(page),
             },
         )
-        data = js.get("data") or []
-        cards.extend(data)
+        yield from js.get("data") or []
         if not js.get("has_more"):
             break
         page += 1
-    return cards
+
+
+MANIFEST_FIELDS = (
+    "set_code", "collector_number", "scryfall_id", "layout", "face",
+    "image_url", "target_filename", "rotate", "status", "error",
+)
+_manifest_row_values = operator.attrgetter(*MANIFEST_FIELDS)
 
 
 def write_manifest_csv(path: Path, rows: List[ManifestRow]) -> None:
+    # Whole CSV built in memory (one writerows) and written with a single write
+    sio = io.StringIO()
+    w = csv.writer(sio)
+    w.writerow(MANIFEST_FIELDS)
+    w.writerows(map(_manifest_row_values, rows))
     safe_mkdir(path.parent)
     with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow([
-            "set_code", "collector_number", "scryfall_id", "layout", "face",
-            "image_url", "target_filename", "rotate", "status", "error"
-        ])
-        for r in rows:
-            w.writerow([
-                r.set_code, r.collector_number, r.scryfall_id, r.layout, r.face,
-                r.image_url, r.target_filename, r.rotate, r.status, r.error
-            ])
+        f.write(sio.getvalue())
 
 
 def read_manifest_csv(path: Path) -> List[ManifestRow]:
-    with open(path, "r", newline="", encoding="utf-8") as f:
-        rd = csv.DictReader(f)
+    with open(path, "r", newline="", encoding="utf-8", buffering=MANIFEST_READ_BUFFER) as f:
+        rd = csv.reader(f)
+        header = next(rd, None)
+        if not header:
+            return []
+        # Our own writer always emits MANIFEST_FIELDS in order -> plain unpacking, no dict per row.
+        # Other layouts (hand-edited / older files) are remapped by column name; missing -> "".
+        col = {h: i for i, h in enumerate(header)}
+        pick = [col.get(name) for name in MANIFEST_FIELDS]
+        positional = tuple(header) == MANIFEST_FIELDS
+        width = len(MANIFEST_FIELDS)
         out: List[ManifestRow] = []
         for row in rd:
+            if not row:
+                continue
+            if not (positional and len(row) == width):
+                row = [row[i] if i is not None and i < len(row) else "" for i in pick]
+            sc, cn, sid, layout, face, url, target, rotate, status, error = row
             out.append(ManifestRow(
-                set_code=row.get("set_code", ""),
-                collector_number=row.get("collector_number", ""),
-                scryfall_id=row.get("scryfall_id", ""),
-                layout=row.get("layout", ""),
-                face=int(row.get("face", "1") or 1),
-                image_url=row.get("image_url", ""),
-                target_filename=row.get("target_filename", ""),
-                rotate=row.get("rotate", "") or "",
-                status=row.get("status", "pending") or "pending",
-                error=row.get("error", "") or "",
+                sc, cn, sid, layout, int(face or 1), url, target, rotate, status or "pending", error
             ))
         return out
 
 
+def iter_manifest_names(path: Path) -> Iterable[str]:
+    """
+    Stream only the target_filename column (no ManifestRow objects).
+    Used by batch preflight scans that just need to know what should exist on disk.
+    """
+    with open(path, "r", newline="", encoding="utf-8", buffering=MANIFEST_READ_BUFFER) as f:
+        rd = csv.reader(f)
+        header = next(rd, None)
+        if not header:
+            return
+        col = header.index("target_filename")
+        for row in rd:
+            if len(row) > col:
+                yield row[col]
+
+
+# Prefix of every line state_line() writes (json.dumps default separators). Target names are
+# slugified, so they never hold quotes or backslashes; anything else falls back to json.loads.
+STATE_LINE_RE = re.compile(r'\{"target": "([^"\\]+)", "status": "([^"\\]+)"[,}]')
+
+
 def load_state_done(state_path: Path) -> Dict[str, str]:
     """
     Returns mapping target_filename -> status ("done" or "failed").
@@ -297,8 +460,13 @@ def load_state_done(state_path: Path) -> Dict[str, str]:
     done: Dict[str, str] = {}
     if not state_path.exists():
         return done
+    match = STATE_LINE_RE.match
     with open(state_path, "r", encoding="utf-8") as f:
         for line in f:
+            m = match(line)
+            if m:  # our own state_line() output: no json.loads needed
+                done[m.group(1)] = m.group(2)
+                continue
             line = line.strip()
             if not line:
                 continue
@@ -313,21 +481,33 @@ def load_state_done(state_path: Path) -> Dict[str, str]:
     return done
 
 
-def append_state(state_path: Path, *, target: str, status: str, error: str = "") -> None:
+def open_state(state_path: Path):
+    """Append handle kept open for a whole run (one open/close instead of one per image)."""
     safe_mkdir(state_path.parent)
+    return open(state_path, "a", encoding="utf-8", buffering=STATE_BUFFER)
+
+
+def state_line(*, target: str, status: str, error: str = "") -> str:
     rec = {"target": target, "status": status}
     if error:
         rec["error"] = error[:300]
-    with open(state_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    return json.dumps(rec, ensure_ascii=False) + "\n"
+
+
+def flush_state(state_f, batch: List[str]) -> None:
+    """One writelines + flush per batch of records (instead of a write per finished image)."""
+    if batch:
+        state_f.writelines(batch)
+        state_f.flush()
+        batch.clear()
 
 
 def atomic_write_bytes(final_path: Path, content: bytes) -> None:
     """
     Write to *.part then rename to final.
+    The folder must exist (run_download creates out_dir once before the workers start).
     """
     tmp = final_path.with_suffix(final_path.suffix + ".part")
-    safe_mkdir(final_path.parent)
 
     with open(tmp, "wb") as f:
         f.write(content)
@@ -348,16 +528,20 @@ def apply_rotation_if_needed(content: bytes, rotate_mode: str) -> bytes:
 
     try:
         img = Image.open(BytesIO(content))
+        # transpose = exact pixel reorder; Pillow drops the GIL in decode/transpose/encode,
+        # so the download threads already rotate in parallel (no process pool needed)
         if rotate_mode == "rot180":
-            img = img.rotate(180, expand=True).convert("RGB")
+            img = img.transpose(Image.Transpose.ROTATE_180)
         elif rotate_mode == "h90":
             w, h = img.size
             if w > h:
-                img = img.rotate(90, expand=True).convert("RGB")
+                img = img.transpose(Image.Transpose.ROTATE_90)
             else:
                 return content
         else:
             return content
+        if img.mode != "RGB":
+            img = img.convert("RGB")
 
         # Always emit JPEG for rotated variants (consistent with your previous behavior)
         out = BytesIO()
@@ -367,53 +551,84 @@ def apply_rotation_if_needed(content: bytes, rotate_mode: str) -> bytes:
         return content
 
 
-def build_manifest_for_set(set_code: str, manifest_path: Path) -> List[ManifestRow]:
+def manifest_rows_for_card(card: dict, set_code_norm: str, counters: Dict[str, int]) -> List[ManifestRow]:
+    """Rows for one card; `counters` carries the per-name duplicate index across the set."""
+    rows: List[ManifestRow] = []
+    sc_id = str(card.get("id") or "")
+    layout = str(card.get("layout") or "").lower()
+    collector = str(card.get("collector_number") or "")
+    set_upper = str(card.get("set") or set_code_norm).upper()
+
+    entries = pick_image_entries(card)
+    if not entries:
+        return rows
+
+    for (url, nm, face_index, rotate) in entries:
+        ext = infer_ext(url)
+        if rotate in {"rot180", "h90"}:
+            ext = ".jpg"
+
+        base_key = slugify_filename(nm)
+        idx = counters.get(base_key, 0) + 1
+        counters[base_key] = idx
+
+        target = build_target_filename_from_slug(base_key, idx, ext)
+
+        rows.append(ManifestRow(
+            set_code=set_upper,
+            collector_number=collector,
+            scryfall_id=sc_id,
+            layout=layout,
+            face=face_index,
+            image_url=url,
+            target_filename=target,
+            rotate=rotate or "",
+            status="pending",
+            error="",
+        ))
+    return rows
+
+
+def build_manifest_for_set(
+    set_code: str,
+    manifest_path: Path,
+    collector_numbers: Optional[List[str]] = None,
+) -> List[ManifestRow]:
     set_code_norm = (set_code or "").strip().lower()
     if not set_code_norm:
         raise ValueError("Empty set code.")
 
-    cards = scryfall_cards_for_set(set_code_norm)
+    cards = iter_scryfall_cards_for_set(set_code_norm)
+    # A subset still walks the whole set: the duplicate index (Forest9...) depends on every
+    # earlier print of the name, so only the full set's order gives the names a full run used
+    wanted = set(collector_numbers) if collector_numbers else None
 
     # Deterministic duplicate suffixing per base key inside this set
     # base key = "<SET>_<slugified name>"
     counters: Dict[str, int] = {}
 
+    # Rows hit the CSV while later pages are still being fetched; *.part until complete,
+    # so an interrupted build never leaves a truncated manifest for run_download to trust
+    tmp = manifest_path.with_suffix(manifest_path.suffix + ".part")
+    safe_mkdir(manifest_path.parent)
     rows: List[ManifestRow] = []
-    for card in cards:
-        sc_id = str(card.get("id") or "")
-        layout = str(card.get("layout") or "").lower()
-        collector = str(card.get("collector_number") or "")
-        set_upper = str(card.get("set") or set_code_norm).upper()
-
-        entries = pick_image_entries(card)
-        if not entries:
-            continue
-
-        for (url, nm, face_index, rotate) in entries:
-            ext = infer_ext(url)
-            if rotate in {"rot180", "h90"}:
-                ext = ".jpg"
-
-            base_key = slugify_filename(nm)
-            counters[base_key] = counters.get(base_key, 0) + 1
-            idx = counters[base_key]
-
-            target = build_target_filename(set_upper, nm, idx, ext)
-
-            rows.append(ManifestRow(
-                set_code=set_upper,
-                collector_number=collector,
-                scryfall_id=sc_id,
-                layout=layout,
-                face=face_index,
-                image_url=url,
-                target_filename=target,
-                rotate=rotate or "",
-                status="pending",
-                error="",
-            ))
-
-    write_manifest_csv(manifest_path, rows)
+    try:
+        with open(tmp, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(MANIFEST_FIELDS)
+            for card in cards:
+                card_rows = manifest_rows_for_card(card, set_code_norm, counters)
+                if wanted is not None and str(card.get("collector_number") or "") not in wanted:
+                    continue
+                w.writerows(map(_manifest_row_values, card_rows))
+                rows.extend(card_rows)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    os.replace(str(tmp), str(manifest_path))
     return rows
 
 
@@ -428,6 +643,11 @@ def download_one(row: ManifestRow, out_dir: Path) -> Tuple[str, str, str]:
         return (row.target_filename, "done", "")
 
     try:
+        if not row.rotate or Image is None:
+            # nothing to transform: socket -> *.part -> final, never holding the whole image
+            dl_stream_to_file(row.image_url, final_path)
+            return (row.target_filename, "done", "")
+
         content = dl_get_bytes(row.image_url)
 
         # apply rotation logic if requested (PIL optional)
@@ -439,6 +659,60 @@ def download_one(row: ManifestRow, out_dir: Path) -> Tuple[str, str, str]:
         return (row.target_filename, "failed", str(e))
 
 
+def download_shared(rows: List[ManifestRow], out_dir: Path) -> List[Tuple[str, str, str]]:
+    """
+    Several rows pointing at the same image_url (flip: face 1 + face 2 rot180, ...):
+    fetch the bytes once and write every target from them.
+    Returns one (target_filename, status, error) per row.
+    """
+    if len(rows) == 1:
+        return [download_one(rows[0], out_dir)]
+
+    todo: List[ManifestRow] = []
+    results: List[Tuple[str, str, str]] = []
+    for row in rows:
+        final_path = out_dir / row.target_filename
+        if final_path.exists() and final_path.stat().st_size > 0:
+            results.append((row.target_filename, "done", ""))
+        else:
+            todo.append(row)
+    if not todo:
+        return results
+
+    try:
+        content = dl_get_bytes(todo[0].image_url)
+    except Exception as e:
+        return results + [(row.target_filename, "failed", str(e)) for row in todo]
+
+    for row in todo:
+        try:
+            atomic_write_bytes(out_dir / row.target_filename, apply_rotation_if_needed(content, row.rotate))
+            results.append((row.target_filename, "done", ""))
+        except Exception as e:
+            results.append((row.target_filename, "failed", str(e)))
+    return results
+
+
+def nonempty_files(folder: Path) -> set:
+    """
+    Names (os.path.normcase'd, so Windows stays case-insensitive) of non-empty files in
+    `folder` from one os.scandir pass (replaces exists()+stat() per manifest row).
+    Missing folder => empty set.
+    """
+    names = set()
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                try:
+                    if e.is_file() and e.stat().st_size > 0:
+                        names.add(os.path.normcase(e.name))
+                except OSError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return names
+
+
 def run_download(manifest_path: Path, out_dir: Path, threads: int) -> None:
     rows = read_manifest_csv(manifest_path)
     state_path = manifest_path.with_suffix(".state.jsonl")
@@ -451,10 +725,10 @@ def run_download(manifest_path: Path, out_dir: Path, threads: int) -> None:
     # - file exists
     pending: List[ManifestRow] = []
     done_count = 0
+    existing = nonempty_files(out_dir)
 
     for r in rows:
-        fp = out_dir / r.target_filename
-        file_ok = fp.exists() and fp.stat().st_size > 0
+        file_ok = os.path.normcase(r.target_filename) in existing
 
         st = state.get(r.target_filename)
 
@@ -481,37 +755,52 @@ def run_download(manifest_path: Path, out_dir: Path, threads: int) -> None:
         print("[fastcsv] Nothing to download.")
         return
 
-    safe_mkdir(out_dir)
+    safe_mkdir(out_dir)  # the only mkdir for the whole run; per-file writes assume it exists
+    ensure_pool_size(max(HTTP_POOL_SIZE, threads))
+    DL_GATE.reset(max(1, threads))
 
     # Concurrency
     ok = 0
     fail = 0
     start = time.time()
 
-    with ThreadPoolExecutor(max_workers=max(1, threads)) as ex:
-        futures = {ex.submit(download_one, r, out_dir): r for r in pending}
-        for fut in as_completed(futures):
-            target, status, err = fut.result()
-            if status == "done":
-                ok += 1
-                append_state(state_path, target=target, status="done")
-            else:
-                fail += 1
-                append_state(state_path, target=target, status="failed", error=err)
-                # keep it short in console
-                print(f"[fail] {target} :: {err}")
+    state_f = open_state(state_path)
+    state_batch: List[str] = []
+    state2 = dict(state)  # kept current in memory (what the jsonl replay would give after this run)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as ex:
+            # one request per distinct URL; rows sharing it are written from the same bytes
+            by_url: Dict[str, List[ManifestRow]] = {}
+            for r in pending:
+                by_url.setdefault(r.image_url, []).append(r)
+            futures = [ex.submit(download_shared, group, out_dir) for group in by_url.values()]
+            for fut in as_completed(futures):
+                for target, status, err in fut.result():
+                    state2[target] = status
+                    if status == "done":
+                        ok += 1
+                        state_batch.append(state_line(target=target, status="done"))
+                    else:
+                        fail += 1
+                        state_batch.append(state_line(target=target, status="failed", error=err))
+                        # keep it short in console
+                        print(f"[fail] {target} :: {err}")
+                if len(state_batch) >= STATE_FLUSH_EVERY:
+                    flush_state(state_f, state_batch)
+    finally:
+        flush_state(state_f, state_batch)
+        state_f.close()
 
     elapsed = time.time() - start
     speed = ok / elapsed if elapsed > 0 else 0.0
     print(f"[fastcsv] Download finished. ok={ok} fail={fail} elapsed={elapsed:.1f}s speed={speed:.2f} img/s")
 
     # Update CSV status (rewrite once at end)
-    # We merge state into rows:
-    state2 = load_state_done(state_path)
+    # We merge state into rows (state2 already includes this run's results):
+    existing = nonempty_files(out_dir)  # one rescan after the downloads
     updated: List[ManifestRow] = []
     for r in rows:
-        fp = out_dir / r.target_filename
-        file_ok = fp.exists() and fp.stat().st_size > 0
+        file_ok = os.path.normcase(r.target_filename) in existing
 
         st = r.status
         er = r.error
@@ -567,20 +856,48 @@ def default_paths(root: Path, set_code: str) -> Tuple[Path, Path]:
     return manifest_path, cards
 
 
+def subset_manifest_path(manifest_path: Path) -> Path:
+    """manifests/<SET>.numbers.csv: a --numbers run never replaces the full set's manifest."""
+    return manifest_path.with_suffix(".numbers.csv")
+
+
+def build_subset_manifest(
+    set_code: str, full_manifest: Path, subset_path: Path, collector_numbers: List[str]
+) -> List[ManifestRow]:
+    """
+    Rows for the listed collector numbers only, named exactly as the full set names them.
+    An existing full manifest is filtered locally; otherwise the set is fetched and filtered.
+    """
+    if not full_manifest.exists():
+        return build_manifest_for_set(set_code, subset_path, collector_numbers)
+    wanted = set(collector_numbers)
+    rows = [r for r in read_manifest_csv(full_manifest) if r.collector_number in wanted]
+    write_manifest_csv(subset_path, rows)
+    return rows
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Fast CSV per-set manifest + downloader (resume)")
     ap.add_argument("--set", dest="set_code", required=True, help="Set code (e.g., one, m21, con)")
     ap.add_argument("--mode", choices=["build", "download", "all"], default="all", help="What to do")
     ap.add_argument("--root", default=".", help="Root folder for manifests/ and Cards/")
     ap.add_argument("--threads", type=int, default=16, help="Download threads")
+    ap.add_argument("--numbers", default="", help="Only these collector numbers, comma-separated (e.g., 1,2,15a); uses manifests/<SET>.numbers.csv")
     args = ap.parse_args()
+    numbers = [n.strip() for n in args.numbers.split(",") if n.strip()]
 
     root = Path(args.root).resolve()
     manifest_path, out_dir = default_paths(root, args.set_code)
+    full_manifest = manifest_path
+    if numbers:
+        manifest_path = subset_manifest_path(manifest_path)
 
     if args.mode in {"build", "all"}:
         print(f"[fastcsv] Building manifest for SET={args.set_code} ...")
-        rows = build_manifest_for_set(args.set_code, manifest_path)
+        if numbers:
+            rows = build_subset_manifest(args.set_code, full_manifest, manifest_path, numbers)
+        else:
+            rows = build_manifest_for_set(args.set_code, manifest_path)
         print(f"[fastcsv] Manifest written: {manifest_path} (rows={len(rows)})")
 
     if args.mode in {"download", "all"}: